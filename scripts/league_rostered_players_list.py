@@ -46,22 +46,33 @@ existing processed data from draft_dump and transactions_dump.
 
 import argparse
 import json
+import os
 import sys
 import hashlib
+import heapq
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import orjson  # optional; faster JSON encode/decode when installed
+except ImportError:
+    orjson = None
 
 from src.config.env import get_export_dir
 from src.util_time import RunTimestamps, make_run_timestamps
 from src.auth.oauth import get_session
+from src.yahoo.normalize import intern_value
 import math
 
 
 # ---------------- Data models ----------------
 
 
-@dataclass
+# slots: one instance per player in the league, so drop the per-instance __dict__.
+@dataclass(slots=True)
 class PlayerSummary:
     player_key: str
     player_name: Optional[str] = None
@@ -108,20 +119,135 @@ def _ensure_dirs(paths: Paths) -> None:
 
 
 def _sha256_of_file(path: Path) -> str:
-    h = hashlib.sha256()
     with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
+        # Python 3.11+: hashed in C with the GIL released.
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        h = hashlib.sha256()
+        for chunk in iter(lambda: f.read(1 << 20), b""):
             h.update(chunk)
     return h.hexdigest()
 
 
-def _dump_json(data: Any, path: Path, pretty: bool) -> None:
+def _stat_or_none(path: Path) -> Optional[os.stat_result]:
+    try:
+        return path.stat()
+    except FileNotFoundError:
+        return None
+
+
+def _read_json(path: Path) -> Any:
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with path.open("r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+class _HashingWriter:
+    """Binary file wrapper that sha256-hashes every chunk as it is written."""
+
+    __slots__ = ("_f", "_h")
+
+    def __init__(self, f: Any) -> None:
+        self._f = f
+        self._h = hashlib.sha256()
+
+    def write(self, data: bytes) -> int:
+        self._h.update(data)
+        return self._f.write(data)
+
+    def hexdigest(self) -> str:
+        return self._h.hexdigest()
+
+
+def _dump_json(data: Any, path: Path, pretty: bool, atomic: bool = False) -> str:
+    """Write ``data`` as JSON and return the sha256 of the bytes written.
+
+    With ``atomic=True`` the JSON goes to a sibling ``.tmp`` file that is
+    fsynced and then ``os.replace``d over ``path``, so readers never see a
+    truncated file.
+    """
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        if pretty:
-            json.dump(data, f, indent=2, sort_keys=False)
+    target = path.with_suffix(path.suffix + ".tmp") if atomic else path
+    with target.open("wb") as f:
+        w = _HashingWriter(f)
+        if orjson is not None:
+            w.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0))
         else:
-            json.dump(data, f, separators=(",", ":"), sort_keys=False)
+            if pretty:
+                encoder = json.JSONEncoder(indent=2, sort_keys=False)
+            else:
+                encoder = json.JSONEncoder(separators=(",", ":"), sort_keys=False)
+            for chunk in encoder.iterencode(data):
+                w.write(chunk.encode("utf-8"))
+        if atomic:
+            f.flush()
+            os.fsync(f.fileno())
+    if atomic:
+        os.replace(target, path)
+    return w.hexdigest()
+
+
+def _compact_json_bytes(data: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":"), sort_keys=False).encode("utf-8")
+
+
+def _player_record(p: PlayerSummary) -> Dict[str, Any]:
+    return {
+        "player_key": p.player_key,
+        "player_name": p.player_name,
+        "drafted_team_key": p.drafted_team_key,
+        "drafted_team_name": p.drafted_team_name,
+        "last_move_type": p.last_move_type,
+        "last_move_team_key": p.last_move_team_key,
+        "last_move_team_name": p.last_move_team_name,
+        "last_move_source": p.last_move_source,
+        "last_move_timestamp_unix": p.last_move_timestamp_unix,
+    }
+
+
+_PLAYER_FIELDS = (
+    "player_key",
+    "player_name",
+    "drafted_team_key",
+    "drafted_team_name",
+    "last_move_type",
+    "last_move_team_key",
+    "last_move_team_name",
+    "last_move_source",
+    "last_move_timestamp_unix",
+)
+
+
+def _player_columns(players: List[PlayerSummary]) -> Dict[str, List[Any]]:
+    """Column-oriented view of the players: one list per field, same order."""
+    return {field: [getattr(p, field) for p in players] for field in _PLAYER_FIELDS}
+
+
+def _stream_processed_json(
+    header: Dict[str, Any], players: Iterable[PlayerSummary], path: Path
+) -> str:
+    """Write ``{**header, "players": [...]}`` compactly, one record at a time.
+
+    ``header`` must be non-empty; the players array is always emitted last.
+
+    Output is byte-identical to ``_dump_json(..., pretty=False)`` but the
+    players array is never materialized as a list of dicts. Returns the
+    sha256 of the bytes written.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("wb") as f:
+        w = _HashingWriter(f)
+        w.write(_compact_json_bytes(header)[:-1])
+        w.write(b',"players":[')
+        for i, p in enumerate(players):
+            if i:
+                w.write(b",")
+            w.write(_compact_json_bytes(_player_record(p)))
+        w.write(b"]}")
+    return w.hexdigest()
 
 
 # ---------------- Meta + input loading ----------------
@@ -138,8 +264,7 @@ def _load_latest_meta(league_key: str, meta_dir: Path) -> Dict[str, Any]:
         sys.exit(1)
 
     try:
-        with latest_path.open("r", encoding="utf-8") as f:
-            latest = json.load(f)
+        latest = _read_json(latest_path)
     except Exception as exc:  # pragma: no cover - defensive
         print(f"ERROR: Failed to parse _meta/latest.json ({exc}).", file=sys.stderr)
         sys.exit(1)
@@ -159,75 +284,77 @@ def _require_block(latest: Dict[str, Any], key: str, league_key: str) -> Dict[st
     return block
 
 
+def _load_json_input(path: Path, label: str) -> Dict[str, Any]:
+    try:
+        return _read_json(path)
+    except Exception as exc:
+        print(f"ERROR: Failed to parse {label} processed JSON at '{path}' ({exc}).", file=sys.stderr)
+        sys.exit(1)
+
+
 def _load_inputs_for_league(paths: Paths, league_key: str) -> Dict[str, Any]:
+    """Load the upstream processed JSON and keep only what the merge consumes.
+
+    The full dump documents are dropped as soon as their arrays are pulled out,
+    so the merge below works from plain iterables (teams, draft_results,
+    transactions) plus the small league_info/scoring headers.
+    """
     latest = _load_latest_meta(league_key, paths.meta_dir)
 
     league_block = _require_block(latest, "league_dump", league_key)
     draft_block = _require_block(latest, "draft_dump", league_key)
     tx_block = _require_block(latest, "transactions_dump", league_key)
 
-    league_path = paths.league_root / league_block["processed"]
-    draft_path = paths.league_root / draft_block["processed"]
-    tx_path = paths.league_root / tx_block["processed"]
-
-    try:
-        with league_path.open("r", encoding="utf-8") as f:
-            league_dump = json.load(f)
-    except Exception as exc:
-        print(f"ERROR: Failed to parse league_dump processed JSON at '{league_path}' ({exc}).", file=sys.stderr)
-        sys.exit(1)
-
-    try:
-        with draft_path.open("r", encoding="utf-8") as f:
-            draft_dump = json.load(f)
-    except Exception as exc:
-        print(f"ERROR: Failed to parse draft_dump processed JSON at '{draft_path}' ({exc}).", file=sys.stderr)
-        sys.exit(1)
-
-    try:
-        with tx_path.open("r", encoding="utf-8") as f:
-            tx_dump = json.load(f)
-    except Exception as exc:
-        print(
-            f"ERROR: Failed to parse transactions_dump processed JSON at '{tx_path}' ({exc}).",
-            file=sys.stderr,
-        )
-        sys.exit(1)
+    league_dump = _load_json_input(paths.league_root / league_block["processed"], "league_dump")
+    draft_dump = _load_json_input(paths.league_root / draft_block["processed"], "draft_dump")
+    tx_dump = _load_json_input(paths.league_root / tx_block["processed"], "transactions_dump")
 
     return {
         "latest": latest,
-        "league_dump": league_dump,
-        "draft_dump": draft_dump,
-        "transactions_dump": tx_dump,
+        "league_info": league_dump.get("league_info") or {},
+        "scoring": league_dump.get("scoring") or {},
+        "teams": league_dump.get("teams") or [],
+        "draft_results": draft_dump.get("draft_results") or [],
+        "transactions": tx_dump.get("transactions") or [],
     }
 
 
 # ---------------- Core merge logic ----------------
 
 
-def _build_team_name_map(league_dump: Dict[str, Any]) -> Dict[str, str]:
-    teams = league_dump.get("teams") or []
-    out: Dict[str, str] = {}
+def _build_team_name_map(teams: Iterable[Any]) -> Dict[str, str]:
+    names: Dict[str, str] = {}
     for t in teams:
-        if not isinstance(t, dict):
+        try:
+            team_key, name = t["team_key"], t["name"]
+        except (TypeError, KeyError):
             continue
-        tk = t.get("team_key")
-        name = t.get("name")
-        if tk and isinstance(name, str):
-            out[tk] = name
-    return out
+        if team_key and isinstance(name, str):
+            names[intern_value(team_key)] = name
+    return names
+
+
+# Exact move types seen from Yahoo; anything else falls back to prefix rules.
+_MOVE_TYPE_MAP: Dict[str, str] = {
+    "add": "add",
+    "waiver_add": "add",
+    "drop": "drop",
+    "waiver_drop": "drop",
+    "trade": "trade",
+    "draft": "drafted",
+    "drafted": "drafted",
+}
 
 
 def _normalize_move_type(raw: Optional[str]) -> str:
     s = (raw or "").lower()
-    if s in {"add", "waiver_add"} or s.startswith("add"):
+    mapped = _MOVE_TYPE_MAP.get(s)
+    if mapped is not None:
+        return mapped
+    if s.startswith("add"):
         return "add"
-    if s in {"drop", "waiver_drop"} or s.startswith("drop"):
+    if s.startswith("drop"):
         return "drop"
-    if s == "trade":
-        return "trade"
-    if s in {"draft", "drafted"}:
-        return "drafted"
     return s or "other"
 
 
@@ -239,35 +366,59 @@ def _update_last_move(
     team_name: Optional[str],
     source: str,
 ) -> None:
-    """Update the 'last move' fields if this event is newer."""
-    if ts_unix is None:
-        # Only override if we don't have any timestamp yet.
-        if player.last_move_timestamp_unix is None:
-            player.last_move_timestamp_unix = None
-            player.last_move_type = move_type
-            player.last_move_team_key = team_key
-            player.last_move_team_name = team_name
-            player.last_move_source = source
-        return
-
-    if player.last_move_timestamp_unix is None or ts_unix >= player.last_move_timestamp_unix:
-        player.last_move_timestamp_unix = ts_unix
-        player.last_move_type = move_type
-        player.last_move_team_key = team_key
-        player.last_move_team_name = team_name
-        player.last_move_source = source
+    """Record this event as the player's last move.
+
+    Callers feed events in ascending timestamp order, so the newest event is
+    simply the last one written.
+    """
+    player.last_move_timestamp_unix = ts_unix
+    player.last_move_type = move_type
+    player.last_move_team_key = team_key
+    player.last_move_team_name = team_name
+    player.last_move_source = source
+
+
+def _tx_timestamp(tx: Dict[str, Any]) -> Optional[float]:
+    ts_raw = tx.get("timestamp_unix")
+    try:
+        return float(ts_raw) if ts_raw is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+# Which side of a move a player's "last team" comes from: a drop is
+# attributed to the team that let the player go, every other move (add,
+# trade, fallback) to the destination. (key, name) fields, preferred first.
+_DROP_SIDE_FIELDS = ("from_team_key", "from_team_name", "to_team_key", "to_team_name")
+_DEST_SIDE_FIELDS = ("to_team_key", "to_team_name", "from_team_key", "from_team_name")
+
+
+def _tx_moves(tx: Dict[str, Any]) -> List[Any]:
+    moves = tx.get("moves") or []
+    return moves if isinstance(moves, list) else []
+
+
+def _event_sort_key(event: Tuple[Any, ...]) -> float:
+    """Order events by timestamp (first element), undated events first."""
+    ts_unix = event[0]
+    return float("-inf") if ts_unix is None else ts_unix
 
 
 def _build_player_summaries(
-    league_dump: Dict[str, Any],
-    draft_dump: Dict[str, Any],
-    tx_dump: Dict[str, Any],
+    league_info: Dict[str, Any],
+    scoring: Dict[str, Any],
+    teams: Iterable[Any],
+    draft_results: Iterable[Any],
+    transactions: Iterable[Any],
 ) -> List[PlayerSummary]:
-    team_name_by_key = _build_team_name_map(league_dump)
+    """Merge draft results and transactions into one summary per player.
+
+    Each input is consumed in a single forward pass, so any iterable works.
+    """
+    team_name_by_key = _build_team_name_map(teams)
 
     # Draft time (seconds since epoch) if available
     draft_time_unix: Optional[float] = None
-    scoring = league_dump.get("scoring") or {}
     h2h = scoring.get("head_to_head") or {}
     if "draft_time" in h2h:
         try:
@@ -282,101 +433,104 @@ def _build_player_summaries(
             players[player_key] = PlayerSummary(player_key=player_key)
         return players[player_key]
 
-    # 1) Seed from draft_dump
-    for row in draft_dump.get("draft_results", []):
-        if not isinstance(row, dict):
-            continue
-        player_key = row.get("player_key")
-        if not player_key:
+    draft_ts = draft_time_unix if draft_time_unix is not None else 0.0
+
+    # 1) Merge draft picks and transaction moves into one oldest-first stream.
+    #    Every pick is stamped with the draft time; transactions are sorted
+    #    with undated ones first (stable, so equal timestamps keep file order).
+    #    heapq.merge yields picks before moves on equal timestamps, so each
+    #    event simply overwrites the player's previous "last move".
+    draft_events = ((draft_ts, row, None) for row in draft_results)
+
+    # Hot-loop lookups bound to locals (one LOAD_FAST instead of a global/attr lookup).
+    players_get = players.get
+    team_name_get = team_name_by_key.get
+    normalize_move_type = _normalize_move_type
+    update_last_move = _update_last_move
+    intern = intern_value
+
+    # The dumps are produced by this project, so malformed entries are rare;
+    # skip them via exceptions rather than type-checking every row.
+    tx_events = []
+    for tx in transactions:
+        try:
+            tx_events.append((_tx_timestamp(tx), tx))
+        except AttributeError:
             continue
+    tx_events.sort(key=_event_sort_key)
+    move_events = ((ts_unix, mv, tx) for ts_unix, tx in tx_events for mv in _tx_moves(tx))
 
-        team_key = row.get("team_key")
-        team_name = row.get("team_name") or team_name_by_key.get(team_key)
-
-        p = get_player(player_key)
-
-        if p.drafted_team_key is None and team_key:
-            p.drafted_team_key = team_key
-            p.drafted_team_name = team_name
-
-        # Treat the draft as the first "move" for this player.
-        ts = draft_time_unix if draft_time_unix is not None else 0.0
-        _update_last_move(
-            player=p,
-            ts_unix=ts,
-            move_type="drafted",
-            team_key=team_key,
-            team_name=team_name,
-            source="draft_dump",
-        )
-
-    # 2) Merge in transactions_dump
-    for tx in tx_dump.get("transactions", []):
-        if not isinstance(tx, dict):
+    for ts_unix, row, tx in heapq.merge(draft_events, move_events, key=_event_sort_key):
+        try:
+            player_key = row["player_key"]
+        except (TypeError, KeyError):
             continue
+        if not player_key:
+            continue
+        player_key = intern(player_key)
 
-        ts_raw = tx.get("timestamp_unix")
-        try:
-            ts_unix = float(ts_raw) if ts_raw is not None else None
-        except (TypeError, ValueError):
-            ts_unix = None
+        p = players_get(player_key)
+        if p is None:
+            p = players[player_key] = PlayerSummary(player_key=player_key)
 
-        moves = tx.get("moves") or []
-        if not isinstance(moves, list):
-            continue
+        if tx is None:
+            # Draft pick
+            team_key = intern(row.get("team_key"))
+            team_name = row.get("team_name") or team_name_get(team_key)
 
-        for mv in moves:
-            if not isinstance(mv, dict):
-                continue
-            player_key = mv.get("player_key")
-            if not player_key:
-                continue
-
-            p = get_player(player_key)
-
-            # Capture a name if we don't have one yet.
-            mv_name = mv.get("player_name")
-            if isinstance(mv_name, str) and mv_name and not p.player_name:
-                p.player_name = mv_name
-
-            move_type_raw = mv.get("transaction_player_type") or tx.get("type")
-            move_type = _normalize_move_type(move_type_raw)
-
-            from_team_key = mv.get("from_team_key")
-            to_team_key = mv.get("to_team_key")
-            from_team_name = mv.get("from_team_name") or team_name_by_key.get(from_team_key)
-            to_team_name = mv.get("to_team_name") or team_name_by_key.get(to_team_key)
-
-            if move_type == "add":
-                team_key = to_team_key or from_team_key
-                team_name = to_team_name or from_team_name
-            elif move_type == "drop":
-                team_key = from_team_key or to_team_key
-                team_name = from_team_name or to_team_name
-            elif move_type == "trade":
-                # Prefer the destination team as the "last team involved"
-                team_key = to_team_key or from_team_key
-                team_name = to_team_name or from_team_name
-            else:
-                # Fallback: whichever side we have.
-                team_key = to_team_key or from_team_key
-                team_name = to_team_name or from_team_name
+            if p.drafted_team_key is None and team_key:
+                p.drafted_team_key = team_key
+                p.drafted_team_name = team_name
 
-            _update_last_move(
+            update_last_move(
                 player=p,
                 ts_unix=ts_unix,
-                move_type=move_type,
+                move_type="drafted",
                 team_key=team_key,
                 team_name=team_name,
-                source="transactions_dump",
+                source="draft_dump",
             )
+            continue
+
+        mv = row
+
+        # Capture a name if we don't have one yet.
+        mv_name = mv.get("player_name")
+        if isinstance(mv_name, str) and mv_name and not p.player_name:
+            p.player_name = mv_name
+
+        move_type_raw = mv.get("transaction_player_type") or tx.get("type")
+        move_type = normalize_move_type(move_type_raw)
+
+        near_key_f, near_name_f, far_key_f, far_name_f = (
+            _DROP_SIDE_FIELDS if move_type == "drop" else _DEST_SIDE_FIELDS
+        )
+        near_key = intern(mv.get(near_key_f))
+        far_key = intern(mv.get(far_key_f))
+
+        team_key = near_key or far_key
+        team_name = (
+            mv.get(near_name_f)
+            or team_name_get(near_key)
+            or mv.get(far_name_f)
+            or team_name_get(far_key)
+        )
+
+        update_last_move(
+            player=p,
+            ts_unix=ts_unix,
+            move_type=move_type,
+            team_key=team_key,
+            team_name=team_name,
+            source="transactions_dump",
+        )
 
-    # 3) Fetch missing names from Yahoo API
+    # 2) Fetch missing names from Yahoo API
     missing_name_players = [p for p in players.values() if not p.player_name]
     if missing_name_players:
         try:
             session = get_session()
-            base_league = league_dump.get("league_info", {}).get("league_key")
+            base_league = league_info.get("league_key")
             if base_league:
                 # Batch fetch in chunks of 25
                 for i in range(math.ceil(len(missing_name_players) / 25)):
@@ -406,10 +560,11 @@ def _build_player_summaries(
         except Exception as e:
             print(f"Warning: Failed to fetch missing player names from global API: {e}", file=sys.stderr)
 
-    # Return in a stable order
-    out = list(players.values())
-    out.sort(key=lambda p: (p.player_name or "", p.player_key))
-    return out
+    # Return in a stable order (name, then key). Keys are built once up front
+    # and sorted with a C-level itemgetter instead of a per-element lambda.
+    decorated = [((p.player_name or "", p.player_key), p) for p in players.values()]
+    decorated.sort(key=itemgetter(0))
+    return [p for _, p in decorated]
 
 
 # ---------------- Excel + manifest + latest.json ----------------
@@ -445,9 +600,9 @@ def _write_excel(players: List[PlayerSummary], path: Path) -> None:
 
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Players"
+    # Write-only mode streams rows to disk instead of building Cell objects.
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Players")
 
     headers = [
         "player_key",
@@ -461,8 +616,14 @@ def _write_excel(players: List[PlayerSummary], path: Path) -> None:
         "last_move_timestamp_unix",
     ]
 
-    ws.append(headers)
+    # Sheet-level settings must be in place before the first row is written.
+    last_col_letter = get_column_letter(len(headers))
+    ws.auto_filter.ref = f"A1:{last_col_letter}1"
     ws.freeze_panes = "A2"
+    for idx in range(1, len(headers) + 1):
+        ws.column_dimensions[get_column_letter(idx)].width = 22
+
+    ws.append(headers)
 
     for p in players:
         ws.append(
@@ -479,14 +640,6 @@ def _write_excel(players: List[PlayerSummary], path: Path) -> None:
             ]
         )
 
-    # Simple auto-width + autofilter
-    last_col_letter = get_column_letter(len(headers))
-    ws.auto_filter.ref = f"A1:{last_col_letter}1"
-
-    for idx in range(1, len(headers) + 1):
-        col_letter = get_column_letter(idx)
-        ws.column_dimensions[col_letter].width = 22
-
     wb.save(path)
 
 
@@ -495,25 +648,33 @@ def _write_manifest(
     league_key: str,
     run_ts: RunTimestamps,
     cli_args: Dict[str, Any],
-    processed_path: Path,
-    excel_path: Optional[Path],
+    produced: Dict[str, Path],
+    digests: Optional[Dict[str, str]] = None,
 ) -> Path:
+    """Write the run manifest.
+
+    ``produced`` maps league-root-relative POSIX paths (computed once in
+    ``main``) to the absolute files they refer to. ``digests`` holds sha256
+    values already computed while writing; other files are hashed here.
+    """
     paths.manifest_dir.mkdir(parents=True, exist_ok=True)
     manifest_path = paths.manifest_dir / f"manifest.{run_ts.iso_stamp}.json"
 
-    def rel(p: Path) -> str:
-        return p.relative_to(paths.league_root).as_posix()
+    # One stat() per file: it both checks existence and yields the size.
+    stats = {rel: _stat_or_none(p) for rel, p in produced.items()}
+    existing = {rel: p for rel, p in produced.items() if stats[rel] is not None}
+    known = {rel: d for rel, d in (digests or {}).items() if rel in existing}
+    to_hash = {rel: p for rel, p in existing.items() if rel not in known}
+    # Hash any remaining files concurrently (hashing releases the GIL).
+    if to_hash:
+        with ThreadPoolExecutor(max_workers=len(to_hash)) as pool:
+            known.update(zip(to_hash, pool.map(_sha256_of_file, to_hash.values())))
 
     files: Dict[str, Dict[str, Any]] = {}
-    if processed_path.exists():
-        files[rel(processed_path)] = {
-            "size_bytes": processed_path.stat().st_size,
-            "sha256": _sha256_of_file(processed_path),
-        }
-    if excel_path is not None and excel_path.exists():
-        files[rel(excel_path)] = {
-            "size_bytes": excel_path.stat().st_size,
-            "sha256": _sha256_of_file(excel_path),
+    for rel_path in existing:
+        files[rel_path] = {
+            "size_bytes": stats[rel_path].st_size,
+            "sha256": known[rel_path],
         }
 
     manifest = {
@@ -533,15 +694,14 @@ def _write_manifest(
 def _update_latest_meta(
     paths: Paths,
     league_key: str,
-    processed_path: Path,
-    excel_path: Optional[Path],
+    processed_rel: str,
+    excel_rel: Optional[str],
     run_ts: RunTimestamps,
 ) -> None:
     latest_path = paths.meta_dir / "latest.json"
     if latest_path.exists():
         try:
-            with latest_path.open("r", encoding="utf-8") as f:
-                latest = json.load(f)
+            latest = _read_json(latest_path)
         except Exception:
             latest = {}
     else:
@@ -549,22 +709,15 @@ def _update_latest_meta(
 
     latest["league_key"] = league_key
 
-    rel_processed = processed_path.relative_to(paths.league_root).as_posix()
-    rel_excel = (
-        excel_path.relative_to(paths.league_root).as_posix()
-        if excel_path is not None and excel_path.exists()
-        else None
-    )
-
-    block: Dict[str, Any] = {"processed": rel_processed}
-    if rel_excel is not None:
-        block["excel"] = rel_excel
+    block: Dict[str, Any] = {"processed": processed_rel}
+    if excel_rel is not None:
+        block["excel"] = excel_rel
 
     latest["league_rostered_players_list"] = block
     latest["_updated_unix"] = run_ts.unix
     latest["_updated_iso_utc"] = run_ts.iso_utc
 
-    _dump_json(latest, latest_path, pretty=True)
+    _dump_json(latest, latest_path, pretty=True, atomic=True)
 
 
 # ---------------- CLI + main ----------------
@@ -581,6 +734,11 @@ def _parse_args() -> argparse.Namespace:
     p.add_argument("--game", default="nhl", help="Game code (default: nhl)")
     p.add_argument("--pretty", action="store_true", help="Pretty-print JSON outputs")
     p.add_argument("--to-excel", action="store_true", help="Also write an Excel workbook")
+    p.add_argument(
+        "--columnar",
+        action="store_true",
+        help="Emit players as 'players_columnar' (one list per field) instead of a list of records",
+    )
 
     return p.parse_args()
 
@@ -601,40 +759,37 @@ def main() -> None:
     run_ts = make_run_timestamps()
 
     loaded = _load_inputs_for_league(paths, league_key)
-    league_dump = loaded["league_dump"]
-    draft_dump = loaded["draft_dump"]
-    tx_dump = loaded["transactions_dump"]
-
-    players = _build_player_summaries(league_dump, draft_dump, tx_dump)
+    league_info = loaded["league_info"]
+
+    players = _build_player_summaries(
+        league_info=league_info,
+        scoring=loaded["scoring"],
+        teams=loaded["teams"],
+        draft_results=loaded["draft_results"],
+        transactions=loaded["transactions"],
+    )
+    del loaded
 
-    league_info = league_dump.get("league_info") or {}
     season = league_info.get("season")
 
-    processed = {
+    header = {
         "league_key": league_info.get("league_key", league_key),
         "season": season,
         "generated_unix": run_ts.unix,
         "generated_iso_utc": run_ts.iso_utc,
         "generated_iso_local": run_ts.iso_local,
         "player_count": len(players),
-        "players": [
-            {
-                "player_key": p.player_key,
-                "player_name": p.player_name,
-                "drafted_team_key": p.drafted_team_key,
-                "drafted_team_name": p.drafted_team_name,
-                "last_move_type": p.last_move_type,
-                "last_move_team_key": p.last_move_team_key,
-                "last_move_team_name": p.last_move_team_name,
-                "last_move_source": p.last_move_source,
-                "last_move_timestamp_unix": p.last_move_timestamp_unix,
-            }
-            for p in players
-        ],
     }
 
     processed_path = paths.processed_dir / f"players.{run_ts.iso_stamp}.json"
-    _dump_json(processed, processed_path, pretty=args.pretty)
+    if args.columnar:
+        processed = dict(header, players_columnar=_player_columns(players))
+        processed_sha256 = _dump_json(processed, processed_path, pretty=args.pretty)
+    elif args.pretty:
+        processed = dict(header, players=[_player_record(p) for p in players])
+        processed_sha256 = _dump_json(processed, processed_path, pretty=True)
+    else:
+        processed_sha256 = _stream_processed_json(header, players, processed_path)
     print(f"Wrote processed players JSON: {processed_path}")
 
     excel_path: Optional[Path] = None
@@ -643,12 +798,23 @@ def main() -> None:
         _write_excel(players, excel_path)
         print(f"Wrote Excel workbook: {excel_path}")
 
+    # Relative paths are computed once and shared by the manifest + latest.json.
+    processed_rel = processed_path.relative_to(paths.league_root).as_posix()
+    excel_rel: Optional[str] = (
+        excel_path.relative_to(paths.league_root).as_posix() if excel_path is not None else None
+    )
+
+    produced: Dict[str, Path] = {processed_rel: processed_path}
+    if excel_path is not None and excel_rel is not None:
+        produced[excel_rel] = excel_path
+
     cli_args: Dict[str, Any] = {
         "league_key": league_key,
         "league_id": getattr(args, "league_id", None),
         "game": getattr(args, "game", None),
         "pretty": bool(getattr(args, "pretty", False)),
         "to_excel": bool(getattr(args, "to_excel", False)),
+        "columnar": bool(getattr(args, "columnar", False)),
     }
 
     manifest_path = _write_manifest(
@@ -656,16 +822,16 @@ def main() -> None:
         league_key=league_key,
         run_ts=run_ts,
         cli_args=cli_args,
-        processed_path=processed_path,
-        excel_path=excel_path,
+        produced=produced,
+        digests={processed_rel: processed_sha256},
     )
     print(f"Wrote manifest: {manifest_path}")
 
     _update_latest_meta(
         paths=paths,
         league_key=league_key,
-        processed_path=processed_path,
-        excel_path=excel_path,
+        processed_rel=processed_rel,
+        excel_rel=excel_rel,
         run_ts=run_ts,
     )
     print(f"Updated latest metadata: {paths.meta_dir / 'latest.json'}")
@@ -12,10 +12,11 @@ outputs per-player JSON files suitable for later game aggregation.
 
 import argparse
 import json
-import math
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from src.auth.oauth import get_session
 from src.config.env import get_export_dir
@@ -25,6 +26,10 @@ from src.yahoo.api_error import handle_api_error
 
 API_BASE = "https://fantasysports.yahooapis.com/fantasy/v2"
 BATCH_SIZE = 25
+# Concurrent batch requests in flight over the shared session. Kept below
+# requests' default per-host connection pool size (10) so every worker gets a
+# pooled keep-alive connection instead of a fresh TLS handshake.
+FETCH_WORKERS = 4
 
 def _update_latest(season_root: Path, run_ts: RunTimestamps, processed_rel: str, excel_rel: Optional[str] = None, stat_map_rel: Optional[str] = None) -> Path:
     """Update _meta/latest.json for the season."""
@@ -33,8 +38,7 @@ def _update_latest(season_root: Path, run_ts: RunTimestamps, processed_rel: str,
     latest_path = meta_dir / "latest.json"
 
     if latest_path.exists():
-        with latest_path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = json.loads(latest_path.read_text(encoding="utf-8"))
     else:
         data = {"season": season_root.name}
 
@@ -52,8 +56,12 @@ def _update_latest(season_root: Path, run_ts: RunTimestamps, processed_rel: str,
     data["_updated_unix"] = run_ts.unix
     data["_updated_iso_utc"] = run_ts.iso_utc
 
-    with latest_path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, sort_keys=True)
+    new_bytes = json.dumps(data, indent=2, sort_keys=True).encode("utf-8")
+
+    # Write-then-rename so a crash never leaves a truncated latest.json behind.
+    tmp_path = latest_path.with_name(latest_path.name + ".tmp")
+    tmp_path.write_bytes(new_bytes)
+    os.replace(tmp_path, latest_path)
 
     return latest_path
 
@@ -75,8 +83,12 @@ def _to_num(val: Any) -> int | float | str:
     except ValueError:
         return s
 
-def _to_excel(season: str, out_base: Path, stat_map_path: Path, xlsx_path: Path, run_ts: RunTimestamps) -> None:
-    """Generate Excel summary of all players generated during this run."""
+def _to_excel(season: str, out_base: Path, stat_map_path: Path, xlsx_path: Path, run_ts: RunTimestamps, records: Optional[Dict[str, Dict[str, Any]]] = None) -> None:
+    """Generate Excel summary of all players generated during this run.
+
+    ``records`` holds player objects already parsed/written by this run (keyed by
+    player_key); those are used as-is instead of re-reading their files.
+    """
     from openpyxl import Workbook
     from openpyxl.utils import get_column_letter
 
@@ -94,6 +106,10 @@ def _to_excel(season: str, out_base: Path, stat_map_path: Path, xlsx_path: Path,
     for player_dir in out_base.iterdir():
         if player_dir.is_dir():
             for p in player_dir.glob("*.json"):
+                cached = records.get(p.stem) if records else None
+                if cached is not None:
+                    all_players.append(cached)
+                    continue
                 try:
                     all_players.append(json.loads(p.read_text(encoding="utf-8")))
                 except Exception:
@@ -182,6 +198,12 @@ def _fetch_players_batch(session, player_keys: List[str], season: str, league_ke
     return r.json()
 
 
+def _chunks(seq: List[str], size: int) -> Iterator[List[str]]:
+    """Yield consecutive slices of ``seq`` holding at most ``size`` items."""
+    for i in range(0, len(seq), size):
+        yield seq[i : i + size]
+
+
 def _flatten_meta_list(meta_list: List[Any]) -> Dict[str, Any]:
     out: Dict[str, Any] = {}
     for item in meta_list:
@@ -222,7 +244,13 @@ def _find_game_nodes(obj: Any) -> List[Dict[str, Any]]:
     return found
 
 
-def _split_and_write_players(raw_payload: Dict[str, Any], out_base: Path, season: str, run_ts: RunTimestamps, pretty: bool, stat_map: Dict[str, str]) -> None:
+def _split_and_write_players(raw_payload: Dict[str, Any], out_base: Path, season: str, run_ts: RunTimestamps, pretty: bool, stat_map: Dict[str, str], records: Dict[str, Dict[str, Any]]) -> None:
+    """Split a players batch payload into per-player files.
+
+    ``records`` is shared across the run: an entry already parsed for a player
+    (e.g. by the cache check) is merged without re-reading its file, and the
+    final object written for each player is stored back into it.
+    """
     fc = raw_payload.get("fantasy_content") or {}
     # In global/game-scoped payloads, players may exist under league OR game structures.
     container = fc.get("league") or fc.get("game") or fc
@@ -332,9 +360,16 @@ def _split_and_write_players(raw_payload: Dict[str, Any], out_base: Path, season
         player_dir = out_base / player_key
         player_dir.mkdir(parents=True, exist_ok=True)
         out_path = player_dir / f"{player_key}.json"
-        if out_path.exists():
+        existing = records.get(player_key)
+        if existing is None and out_path.exists():
             try:
                 existing = json.loads(out_path.read_text(encoding="utf-8"))
+            except Exception:
+                existing = None
+
+        final_obj = out_obj
+        if isinstance(existing, dict):
+            try:
                 existing["season_totals"] = out_obj.get("season_totals") or existing.get("season_totals")
                 existing["advanced_totals"] = out_obj.get("advanced_totals") or existing.get("advanced_totals")
                 existing["_generated_unix"] = out_obj.get("_generated_unix")
@@ -345,11 +380,12 @@ def _split_and_write_players(raw_payload: Dict[str, Any], out_base: Path, season
                     gid = ge.get("game_id")
                     if gid not in existing_game_ids:
                         existing.setdefault("game_entries", []).append(ge)
-                _dump_json(existing, out_path, pretty)
+                final_obj = existing
             except Exception:
-                _dump_json(out_obj, out_path, pretty)
-        else:
-            _dump_json(out_obj, out_path, pretty)
+                final_obj = out_obj
+
+        _dump_json(final_obj, out_path, pretty)
+        records[player_key] = final_obj
 
 
 def main() -> None:
@@ -359,6 +395,7 @@ def main() -> None:
     ap.add_argument("--stale-hours", type=float, default=0.0, help="Not used (no cache) but kept for parity")
     ap.add_argument("--pretty", action="store_true")
     ap.add_argument("--to-excel", action="store_true", help="Also write an Excel workbook summary")
+    ap.add_argument("--token-file", help="OAuth token JSON to use (default: TOKEN_FILE from .env). A still-valid token is reused without a refresh.")
     args = ap.parse_args()
 
     season = str(args.season)
@@ -366,10 +403,11 @@ def main() -> None:
 
     # Determine player universe: prefer rostered players when league_key provided,
     # otherwise fetch the broader game-scoped player universe via the game endpoint
-    session = get_session()
+    session = get_session(args.token_file)
     season_root = get_export_dir() / season
     out_base = season_root / "playerdata"
     stat_map: Dict[str, str] = {}
+    records: Dict[str, Dict[str, Any]] = {}
     
     # Query Yahoo global stat_categories API to seed the exact valid stat_map IDs and names
     try:
@@ -404,8 +442,12 @@ def main() -> None:
             sys.exit(1)
         roster_path = league_root / roster_block["processed"]
         roster = json.loads(roster_path.read_text(encoding="utf-8"))
-        player_items = roster.get("players") or []
-        player_keys = [p.get("player_key") for p in player_items if isinstance(p, dict) and p.get("player_key")]
+        if "players_columnar" in roster:
+            # Written by league_rostered_players_list --columnar
+            player_keys = [k for k in roster["players_columnar"].get("player_key") or [] if k]
+        else:
+            player_items = roster.get("players") or []
+            player_keys = [p.get("player_key") for p in player_items if isinstance(p, dict) and p.get("player_key")]
         player_keys = sorted(set(player_keys))
         if not player_keys:
             print("No rostered players found; nothing to do.")
@@ -416,26 +458,44 @@ def main() -> None:
         # Skip this check if no league-key is provided (global run)
         cache_ttl = 7200
         players_to_fetch = []
+        # One directory scan says which players have a cache entry at all; the
+        # file mtime (rewritten together with _generated_unix) then screens out
+        # stale entries without parsing them. The file sits inside a per-player
+        # subdirectory, so the root scan can't supply its mtime and one stat()
+        # per cached player remains.
+        cached_dirs = {e.name for e in os.scandir(out_base) if e.is_dir()} if out_base.is_dir() else set()
         for pk in player_keys:
-            p_path = out_base / pk / f"{pk}.json"
-            if p_path.exists():
+            if pk in cached_dirs:
+                p_path = out_base / pk / f"{pk}.json"
                 try:
-                    p_data = json.loads(p_path.read_text(encoding="utf-8"))
-                    gen_unix = p_data.get("_generated_unix")
-                    if gen_unix and (run_ts.unix - gen_unix) < cache_ttl:
+                    fresh = (run_ts.unix - p_path.stat().st_mtime) < cache_ttl
+                except OSError:
+                    fresh = False
+                if fresh:
+                    # A recent mtime doesn't prove the file is intact: a truncated or
+                    # corrupt entry is re-fetched. The parsed object also feeds the
+                    # Excel summary without another read.
+                    try:
+                        p_data = json.loads(p_path.read_text(encoding="utf-8"))
+                    except Exception:
+                        p_data = None
+                    if isinstance(p_data, dict):
+                        records[pk] = p_data
                         continue # Skip fetch, cache is fresh
-                except Exception:
-                    pass
             players_to_fetch.append(pk)
 
         if players_to_fetch:
             print(f"Fetching {len(players_to_fetch)} players (skipped {len(player_keys) - len(players_to_fetch)} fresh cache entries)")
-            total_fetch = len(players_to_fetch)
-            batches = math.ceil(total_fetch / BATCH_SIZE)
-            for i in range(batches):
-                batch = players_to_fetch[i * BATCH_SIZE : (i + 1) * BATCH_SIZE]
-                raw = _fetch_players_batch(session, batch, season, args.league_key)
-                _split_and_write_players(raw, out_base, season, run_ts, args.pretty, stat_map)
+
+            def _fetch_one(batch: List[str]) -> Dict[str, Any]:
+                return _fetch_players_batch(session, batch, season, args.league_key)
+
+            # Batches are independent, so keep several requests in flight at once.
+            # Parsing/writing stays on this thread (in batch order) because
+            # stat_map and the per-player files are not safe to share.
+            with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as pool:
+                for raw in pool.map(_fetch_one, _chunks(players_to_fetch, BATCH_SIZE)):
+                    _split_and_write_players(raw, out_base, season, run_ts, args.pretty, stat_map, records)
         else:
             print("All players in league have fresh cache (< 2 hours old). Skipping API fetches.")
     else:
@@ -461,7 +521,7 @@ def main() -> None:
                 print(f"No more players found (start={start}). Ending pagination.")
                 break
                 
-            _split_and_write_players(raw, out_base, season, run_ts, args.pretty, stat_map)
+            _split_and_write_players(raw, out_base, season, run_ts, args.pretty, stat_map, records)
             
             print(f"Fetched and processed {players_count} players (start={start})")
             total_processed += int(players_count)
@@ -493,7 +553,7 @@ def main() -> None:
 
     if args.to_excel:
         excel_path = season_root / "playerdata" / f"player_summary.{run_ts.iso_stamp}.xlsx"
-        _to_excel(season, out_base, stat_map_path, excel_path, run_ts)
+        _to_excel(season, out_base, stat_map_path, excel_path, run_ts, records)
         excel_rel = excel_path.relative_to(season_root).as_posix()
         print(f"Wrote Excel summary: {excel_path}")
 
@@ -18,10 +18,22 @@ import base64, json, os, socket, threading, urllib.parse, webbrowser
 from http.server import BaseHTTPRequestHandler, HTTPServer
 from pathlib import Path
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from src.auth.oauth import CLIENT_ID, CLIENT_SECRET, REDIRECT_URI, SCOPE, TOKEN_FILE, _basic_auth_header, TokenBundle, _save_token, YAHOO_TOKEN_URL
 
 AUTH_URL = "https://api.login.yahoo.com/oauth2/request_auth"
 
+def _make_session() -> requests.Session:
+    # One pooled connection to the token endpoint. Retry's default allowed_methods
+    # excludes POST, so only connection failures are retried (an auth code is single-use).
+    sess = requests.Session()
+    retry = Retry(total=3, backoff_factor=0.3)
+    sess.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=1, max_retries=retry))
+    return sess
+
+_SESSION = _make_session()
+
 def _build_auth_url(state: str) -> str:
     params = {
         "client_id": CLIENT_ID,
@@ -54,12 +66,20 @@ class CaptureHandler(BaseHTTPRequestHandler):
     def log_message(self, format, *args):  # silence
         return
 
+CALLBACK_TIMEOUT_SECS = 120
+
+class _CallbackServer(HTTPServer):
+    # Rebind immediately on re-runs instead of waiting out TIME_WAIT.
+    # SO_REUSEPORT is deliberately not set: no other process may share the callback port.
+    allow_reuse_address = True
+
 def _run_server_once() -> tuple[str | None, str | None]:
     url = urllib.parse.urlparse(REDIRECT_URI)
     host, port = url.hostname, url.port or 8765
-    httpd = HTTPServer((host, port), CaptureHandler)
-    # serve one request then stop
-    httpd.handle_request()
+    with _CallbackServer((host, port), CaptureHandler) as httpd:
+        # serve one request then stop; give up if the browser never calls back
+        httpd.timeout = CALLBACK_TIMEOUT_SECS
+        httpd.handle_request()
     return CaptureHandler.code, CaptureHandler.error
 
 def main():
@@ -87,7 +107,7 @@ def main():
         "redirect_uri": REDIRECT_URI,
         "code": code,
     }
-    resp = requests.post(YAHOO_TOKEN_URL, headers=headers, data=data, timeout=30)
+    resp = _SESSION.post(YAHOO_TOKEN_URL, headers=headers, data=data, timeout=30)
     resp.raise_for_status()
     payload = resp.json()
     tb = TokenBundle.from_dict({
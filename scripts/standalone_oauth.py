@@ -12,18 +12,37 @@ if __name__ == "__main__":
 
 from __future__ import annotations
 
-import argparse, base64, http.server, json, logging, os, random, ssl, string, threading, time, urllib.parse, webbrowser
+import argparse, base64, concurrent.futures, functools, http.server, json, logging, os, secrets, threading, time, urllib.parse
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, Optional
 
-import requests
 from dotenv import load_dotenv
 
+if TYPE_CHECKING:
+    import requests
+
+try:
+    import orjson
+except ImportError:  # optional: stdlib json is used when orjson is absent
+    orjson = None
+
 AUTH_URL = "https://api.login.yahoo.com/oauth2/request_auth"
 TOKEN_URL = "https://api.login.yahoo.com/oauth2/get_token"
 USERINFO_URL = "https://api.login.yahoo.com/openid/v1/userinfo"
 
+# Token and userinfo endpoints share one host: a pooled session reuses the TCP+TLS connection across calls.
+# Created on first use so the "token still fresh" exit never pays for importing requests.
+_SESSION: Optional[requests.Session] = None
+
+def _session() -> requests.Session:
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        _SESSION = requests.Session(); _SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+    return _SESSION
+
 def now_epoch() -> int: return int(time.time())
 
 def human_time(ts: int, tz_name: str = "America/Toronto") -> str:
@@ -31,6 +50,7 @@ def human_time(ts: int, tz_name: str = "America/Toronto") -> str:
         dt = datetime.fromtimestamp(ts); return f"{dt.strftime('%Y-%m-%d %H:%M:%S')} ({tz_name})"
     except Exception: return str(ts)
 
+@functools.lru_cache(maxsize=1)  # credentials are fixed per process
 def build_basic_auth_header(client_id: str, client_secret: str) -> str:
     return base64.b64encode(f"{client_id}:{client_secret}".encode("utf-8")).decode("utf-8")
 
@@ -57,71 +77,113 @@ def load_config() -> Dict[str, str]:
     logging.basicConfig(level=getattr(logging, cfg["log_level"], logging.INFO), format="[%(levelname)s] %(message)s"); return cfg
 
 def read_token(path: Path) -> Optional[Dict]:
-    return json.load(path.open("r", encoding="utf-8")) if path.exists() else None
+    if not path.exists(): return None
+    raw = path.read_bytes(); return orjson.loads(raw) if orjson is not None else json.loads(raw)
 
 def write_token(path: Path, data: Dict) -> None:
-    tmp = path.with_suffix(".tmp"); json.dump(data, tmp.open("w", encoding="utf-8"), indent=2); tmp.replace(path)
+    buf = orjson.dumps(data, option=orjson.OPT_INDENT_2) if orjson is not None else json.dumps(data, indent=2).encode("utf-8")
+    tmp = path.with_suffix(".tmp"); tmp.write_bytes(buf); tmp.replace(path)
+
+SOFT_REFRESH_SECS = 600  # refresh proactively once less than this much lifetime remains
+
+def _token_remaining(tok: Dict) -> int: return int(tok.get("expires_at", 0)) - now_epoch()
+
+def token_is_valid(tok: Dict) -> bool: return _token_remaining(tok) > 60
+
+def token_is_fresh(tok: Dict, soft_ttl: int = SOFT_REFRESH_SECS) -> bool: return _token_remaining(tok) > soft_ttl
 
-def token_is_valid(tok: Dict) -> bool: return int(tok.get("expires_at", 0)) - now_epoch() > 60
+def token_needs_refresh(tok: Dict, soft_ttl: int = SOFT_REFRESH_SECS) -> bool:
+    """Still usable, but inside the soft window: refresh now rather than on the next call."""
+    return 0 < _token_remaining(tok) <= soft_ttl
 
-def refresh_token(cfg: Dict[str, str], tok: Dict) -> Dict:
+def refresh_token(cfg: Dict[str, str], tok: Dict, session: Optional[requests.Session] = None) -> Dict:
     logging.info("Refreshing access token...")
     headers = {"Authorization": f"Basic {build_basic_auth_header(cfg['client_id'], cfg['client_secret'])}", "Content-Type": "application/x-www-form-urlencoded"}
     data = {"grant_type": "refresh_token", "redirect_uri": cfg["redirect_uri"], "refresh_token": tok["refresh_token"]}
-    resp = requests.post(TOKEN_URL, headers=headers, data=data, timeout=cfg["http_timeout"])
+    resp = (session or _session()).post(TOKEN_URL, headers=headers, data=data, timeout=cfg["http_timeout"])
     if resp.status_code != 200: raise SystemExit(f"Refresh failed: {resp.status_code} {resp.text}")
     p = resp.json(); new_tok = {**tok, "access_token": p.get("access_token", tok.get("access_token")), "token_type": p.get("token_type", tok.get("token_type", "bearer")), "expires_in": int(p.get("expires_in", tok.get("expires_in", 3600))), "scope": p.get("scope", tok.get("scope"))}
     new_tok["expires_at"] = now_epoch() + int(new_tok["expires_in"]) - 60; logging.info("Token refreshed. Expires at %s", human_time(new_tok["expires_at"], cfg["tz"])); return new_tok
 
+def _query_params(url: str) -> Dict[str, str]:
+    # Flat {key: first value} map; urlsplit skips urlparse's ;params handling and parse_qsl builds no per-key lists.
+    q: Dict[str, str] = {}
+    for k, v in urllib.parse.parse_qsl(urllib.parse.urlsplit(url).query): q.setdefault(k, v)
+    return q
+
 class OAuthHandler(http.server.BaseHTTPRequestHandler):
     server_version = "YahooOAuth/2.0"; _state: str = ""; _code: Optional[str] = None; _error: Optional[str] = None
+    _done: threading.Event = threading.Event()  # set once a callback with the expected state arrives
     def log_message(self, format, *args): logging.debug("HTTP: " + format % args)
     def do_GET(self):
-        parsed = urllib.parse.urlparse(self.path); qs = urllib.parse.parse_qs(parsed.query)
-        state, code, error = qs.get("state", [None])[0], qs.get("code", [None])[0], qs.get("error", [None])[0]
-        if error: self._error = error
-        if code: self._code = code
+        q = _query_params(self.path); state, code, error = q.get("state"), q.get("code"), q.get("error")
         if state != self._state: self.send_response(400); self.end_headers(); self.wfile.write(b"State mismatch. You can close this window."); return
+        # Results live on the class: main() only holds the handler class, never the per-request instance.
+        cls = type(self)
+        if error: cls._error = error
+        if code: cls._code = code
+        if error or code: cls._done.set()
         self.send_response(200); self.end_headers(); self.wfile.write(b"Authorization received. You can close this window." if not error else b"Authorization failed. You can close this window.")
 
 def start_local_server(redirect_uri: str, state: str, tls_cert: str, tls_key: str):
     url = urllib.parse.urlparse(redirect_uri); host, port, scheme = url.hostname, url.port, (url.scheme or "http")
     if not host or not port: raise SystemExit("YAHOO_REDIRECT_URI must include host and port, e.g., https://127.0.0.1:8910/callback")
-    handler_cls = OAuthHandler; handler_cls._state = state
+    handler_cls = OAuthHandler; handler_cls._state = state; handler_cls._code = handler_cls._error = None; handler_cls._done = threading.Event()
     httpd = http.server.HTTPServer((host, port), handler_cls)
     if scheme.lower() == "https":
         if not (tls_cert and tls_key): raise SystemExit("Redirect is HTTPS but TLS_CERT_FILE/TLS_KEY_FILE are not set in .env")
         if not (Path(tls_cert).exists() and Path(tls_key).exists()): raise SystemExit("TLS cert/key files not found. Check TLS_CERT_FILE and TLS_KEY_FILE paths.")
+        import ssl  # only needed for an HTTPS redirect URI
         context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER); context.load_cert_chain(certfile=tls_cert, keyfile=tls_key); httpd.socket = context.wrap_socket(httpd.socket, server_side=True)
     t = threading.Thread(target=httpd.serve_forever, daemon=True); t.start(); return httpd, t, handler_cls
 
-def build_auth_url(client_id: str, redirect_uri: str, scope: str, state: str, prompt: str = "") -> str:
-    params = {'response_type':'code','client_id':client_id,'redirect_uri':redirect_uri,'scope':scope,'state':state}
-    if not scope:
-        params.pop('scope')
-    if prompt:
-        params['prompt'] = prompt
+@functools.lru_cache(maxsize=4)
+def _auth_url_prefix(client_id: str, redirect_uri: str, scope: str) -> str:
+    # The fixed part of the consent URL, encoded once per (client, redirect, scope).
+    params = {'response_type':'code','client_id':client_id,'redirect_uri':redirect_uri}
+    if scope:
+        params['scope'] = scope
     return f"{AUTH_URL}?{urllib.parse.urlencode(params)}"
 
+def build_auth_url(client_id: str, redirect_uri: str, scope: str, state: str, prompt: str = "") -> str:
+    url = f"{_auth_url_prefix(client_id, redirect_uri, scope)}&state={urllib.parse.quote_plus(state)}"
+    return f"{url}&prompt={urllib.parse.quote_plus(prompt)}" if prompt else url
+
 def parse_code_from_url(url: str) -> Optional[str]:
-    try: parsed = urllib.parse.urlparse(url); qs = urllib.parse.parse_qs(parsed.query); return qs.get("code", [None])[0]
+    try: return _query_params(url).get("code")
     except Exception: return None
 
-def exchange_code_for_token(cfg: Dict[str, str], code: str) -> Dict:
+def exchange_code_for_token(cfg: Dict[str, str], code: str, session: Optional[requests.Session] = None) -> Dict:
     headers = {"Authorization": f"Basic {build_basic_auth_header(cfg['client_id'], cfg['client_secret'])}", "Content-Type": "application/x-www-form-urlencoded"}
     data = {"grant_type": "authorization_code", "redirect_uri": cfg["redirect_uri"], "code": code}
-    resp = requests.post(TOKEN_URL, headers=headers, data=data, timeout=cfg["http_timeout"])
+    resp = (session or _session()).post(TOKEN_URL, headers=headers, data=data, timeout=cfg["http_timeout"])
     if resp.status_code != 200: raise SystemExit(f"Token exchange failed: {resp.status_code} {resp.text}")
     p = resp.json(); tok = {"access_token": p["access_token"], "refresh_token": p.get("refresh_token"), "token_type": p.get("token_type", "bearer"), "scope": p.get("scope"), "expires_in": int(p.get("expires_in", 3600))}
     tok["expires_at"] = now_epoch() + tok["expires_in"] - 60; return tok
 
-def fetch_userinfo(cfg: Dict[str, str], access_token: str):
-    try: r = requests.get(USERINFO_URL, headers={"Authorization": f"Bearer {access_token}"}, timeout=cfg["http_timeout"]); return r.json() if r.status_code==200 else None
+def fetch_userinfo(cfg: Dict[str, str], access_token: str, session: Optional[requests.Session] = None):
+    try: r = (session or _session()).get(USERINFO_URL, headers={"Authorization": f"Bearer {access_token}"}, timeout=cfg["http_timeout"]); return r.json() if r.status_code==200 else None
     except Exception: return None
 
-def random_state(n: int = 24) -> str: return ''.join(random.choice(string.ascii_letters + string.digits) for _ in range(n))
+def random_state(n: int = 24) -> str: return secrets.token_urlsafe(max(16, (n * 3) // 4))  # ~n URL-safe chars from the OS CSPRNG
+
+def _save_token_and_userinfo(cfg: Dict, token_path: Path, tok: Dict) -> None:
+    # userinfo is informational only: fetch it in the background while the token is persisted.
+    pool = concurrent.futures.ThreadPoolExecutor(max_workers=1); ui_future = pool.submit(fetch_userinfo, cfg, tok["access_token"])
+    try:
+        write_token(token_path, tok); print(f"Token saved: {token_path}. Expires: {human_time(tok['expires_at'], cfg['tz'])}")
+        try: ui = ui_future.result(timeout=cfg["http_timeout"])
+        except concurrent.futures.TimeoutError: ui = None
+        if ui: print(f"User: {ui.get('sub')}  email: {ui.get('email')}")
+    finally:
+        pool.shutdown(wait=False)
 
 def main() -> int:
+    try: return _run()
+    finally:
+        if _SESSION is not None: _SESSION.close()
+
+def _run() -> int:
     parser = argparse.ArgumentParser(description="Yahoo OAuth/OIDC helper")
     parser.add_argument("--force-consent", action="store_true", help="Add prompt=consent to force re-consent")
     parser.add_argument("--manual", action="store_true", help="Manual paste mode; copy ?code= from the redirected URL")
@@ -132,32 +194,29 @@ def main() -> int:
     cfg = load_config(); manual = args.manual or cfg["manual_env"]; token_path = Path(cfg["token_file"])
     tok = read_token(token_path)
     if tok:
-        if token_is_valid(tok): print(f"Token OK (expires: {human_time(tok['expires_at'], cfg['tz'])})."); return 0
+        if token_is_fresh(tok): print(f"Token OK (expires: {human_time(tok['expires_at'], cfg['tz'])})."); return 0
+        # Still usable but inside the soft window: refresh now so callers never receive a token about to lapse.
+        if token_needs_refresh(tok): logging.info("Token expires within %ds; refreshing ahead of expiry.", SOFT_REFRESH_SECS)
+        else: logging.info("Token expired.")
         new_tok = refresh_token(cfg, tok); write_token(token_path, new_tok); print(f"Token refreshed (expires: {human_time(new_tok['expires_at'], cfg['tz'])})."); return 0
     state = random_state(); url = build_auth_url(cfg["client_id"], cfg["redirect_uri"], cfg["scope"], state, cfg.get("prompt",""))
     print("Open this URL to authorize:"); print(url)
-    try: webbrowser.open(url)
+    try: import webbrowser; webbrowser.open(url)
     except Exception: pass
     if manual:
         print("\\nManual mode: after authorizing, copy the FULL redirected URL and paste it here.")
         pasted = input("Paste redirected URL: ").strip(); code = parse_code_from_url(pasted)
         if not code: raise SystemExit("Could not find ?code= in the pasted URL.")
-        tok = exchange_code_for_token(cfg, code); write_token(token_path, tok); print(f"Token saved: {token_path}. Expires: {human_time(tok['expires_at'], cfg['tz'])}")
-        ui = fetch_userinfo(cfg, tok["access_token"]); 
-        if ui: print(f"User: {ui.get('sub')}  email: {ui.get('email')}"); 
+        tok = exchange_code_for_token(cfg, code); _save_token_and_userinfo(cfg, token_path, tok)
         return 0
     else:
         httpd, thread, handler_cls = start_local_server(cfg["redirect_uri"], state, cfg["tls_cert"], cfg["tls_key"])
         try:
             print("Waiting for browser authorization...")
-            for _ in range(600):
-                if handler_cls._error: raise SystemExit(f"Authorization error: {handler_cls._error}")
-                if handler_cls._code: code = handler_cls._code; break
-                time.sleep(0.5)
-            else: raise SystemExit("Timed out waiting for authorization callback.")
-            tok = exchange_code_for_token(cfg, code); write_token(token_path, tok); print(f"Token saved: {token_path}. Expires: {human_time(tok['expires_at'], cfg['tz'])}")
-            ui = fetch_userinfo(cfg, tok["access_token"]); 
-            if ui: print(f"User: {ui.get('sub')}  email: {ui.get('email')}"); 
+            if not handler_cls._done.wait(timeout=300): raise SystemExit("Timed out waiting for authorization callback.")
+            if handler_cls._error: raise SystemExit(f"Authorization error: {handler_cls._error}")
+            code = handler_cls._code
+            tok = exchange_code_for_token(cfg, code); _save_token_and_userinfo(cfg, token_path, tok)
             return 0
         finally:
             httpd.shutdown(); httpd.server_close()
@@ -13,7 +13,8 @@ and then fetches per-week scoreboard data to build:
 
   exports/<league_key>/standings_dump/
     raw/
-      scoreboard.wkNNN.<ISO>.json
+      scoreboard.wkNNN.<ISO>.json      (.json.gz with --compress-raw)
+      scoreboard.wkNNN.cached.json.gz  (settled weeks; reused unless --refresh)
     processed/
       matchups.<ISO>.json
       weekly.<ISO>.json
@@ -37,12 +38,24 @@ processed JSON and Excel paths (relative to the league root).
 """
 
 import argparse
+import gzip
 import json
 import hashlib
+import io
+import itertools
+import os
+import operator
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:  # optional: stdlib json is used when orjson is absent
+    orjson = None
+
 import sys
 # Add project root to sys.path so we can import from src/
 project_root = str(Path(__file__).resolve().parent.parent)
@@ -54,36 +67,220 @@ from src.config.env import get_export_dir
 from src.util_time import make_run_timestamps, RunTimestamps
 
 from src.yahoo.api_error import handle_api_error
+from src.yahoo.normalize import intern_value
 
 BASE_URL = "https://fantasysports.yahooapis.com/fantasy/v2"
+# Concurrent scoreboard requests; kept modest to stay clear of Yahoo rate limits.
+DEFAULT_CONCURRENCY = 4
+# Yahoo applies stat corrections for a few days after a week ends, so a week is
+# only cached once this many further weeks have started.
+STAT_CORRECTION_GRACE_WEEKS = 1
 
 
 # ---------------- HTTP helpers ----------------
 
 
-def _fetch(endpoint: str) -> dict:
+def _loads(raw: bytes) -> Any:
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _fetch(endpoint: str, session: Any = None) -> Tuple[bytes, dict]:
     """
     Fetch a Fantasy API endpoint as JSON, raising for HTTP errors.
+
+    Returns (response bytes, parsed payload) so callers can snapshot the body
+    without re-encoding it. ``session`` lets callers share one authenticated
+    session across requests; a fresh one is obtained from get_session() otherwise.
     """
-    sess = get_session()
+    sess = session if session is not None else get_session()
     url = f"{BASE_URL}/{endpoint}"
     r = sess.get(url, params={"format": "json"}, headers={"Accept": "application/json"})
     handle_api_error(r, f"endpoint {endpoint}")
-    return r.json()
+    raw = r.content
+    return raw, _loads(raw)
 
 
-def _fetch_scoreboard_week(league_key: str, week: int) -> dict:
+def _fetch_scoreboard_week(league_key: str, week: int, session: Any = None) -> Tuple[bytes, dict]:
     """
-    Fetch /league/{league_key}/scoreboard;week={week} as JSON.
+    Fetch /league/{league_key}/scoreboard;week={week} as (bytes, JSON payload).
     """
     endpoint = f"league/{league_key}/scoreboard;week={week}"
-    return _fetch(endpoint)
+    return _fetch(endpoint, session)
+
+
+def _scoreboard_cache_path(cache_dir: Path, week: int) -> Path:
+    return cache_dir / f"scoreboard.wk{week:03d}.cached.json.gz"
+
+
+def _read_cached_scoreboard(cache_dir: Path, week: int) -> Optional[Tuple[bytes, dict]]:
+    path = _scoreboard_cache_path(cache_dir, week)
+    try:
+        raw = gzip.decompress(path.read_bytes())
+    except (FileNotFoundError, OSError, EOFError):
+        return None
+    try:
+        return raw, _loads(raw)
+    except ValueError:
+        return None
+
+
+def _write_cached_scoreboard(cache_dir: Path, week: int, raw: bytes) -> None:
+    """Store a completed week's scoreboard body; written to a temp file and renamed into place."""
+    path = _scoreboard_cache_path(cache_dir, week)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(gzip.compress(raw, compresslevel=1))
+    os.replace(tmp, path)
+
+
+def _read_recent_snapshot(
+    raw_dir: Path, week: int, max_age_secs: float
+) -> Optional[Tuple[bytes, dict, float]]:
+    """Newest raw scoreboard.wkNNN.<ISO> snapshot for ``week`` if younger than ``max_age_secs``.
+
+    Returns (bytes, payload, mtime). The snapshot written for a reused week
+    keeps this mtime, so the age is always measured from the actual fetch.
+    """
+    newest: Optional[Tuple[float, Path]] = None
+    for path in raw_dir.glob(f"scoreboard.wk{week:03d}.*.json*"):
+        if ".cached." in path.name or path.suffix not in (".json", ".gz"):
+            continue
+        try:
+            mtime = path.stat().st_mtime
+        except OSError:
+            continue
+        if newest is None or mtime > newest[0]:
+            newest = (mtime, path)
+    if newest is None or time.time() - newest[0] > max_age_secs:
+        return None
+    try:
+        raw = newest[1].read_bytes()
+        if newest[1].suffix == ".gz":
+            raw = gzip.decompress(raw)
+        return raw, _loads(raw), newest[0]
+    except (OSError, EOFError, ValueError):
+        return None
+
+
+def _fetch_all_weeks(
+    league_key: str,
+    weeks: List[int],
+    max_workers: int = DEFAULT_CONCURRENCY,
+    cache_dir: Optional[Path] = None,
+    closed_before_week: Optional[int] = None,
+    refresh: bool = False,
+    max_cache_age_hours: float = 0,
+) -> Dict[int, Any]:
+    """
+    Fetch scoreboards for ``weeks`` concurrently over one shared session.
+
+    Returns week -> (response bytes, payload, fetched_at), or week -> the
+    Exception its fetch raised so the caller can warn and skip that week.
+    ``fetched_at`` is the original snapshot time for weeks reused from a recent
+    raw snapshot, else None. Fatal API errors (SystemExit from
+    handle_api_error) still propagate.
+
+    ``closed_before_week`` is ``current_week - STAT_CORRECTION_GRACE_WEEKS``;
+    weeks before it are final, so with a ``cache_dir`` they are served from /
+    saved to a local cache. ``refresh`` ignores existing cache entries (they
+    are still rewritten).
+    With ``max_cache_age_hours`` > 0, any other week whose newest raw snapshot
+    in ``cache_dir`` is younger than that is reused instead of re-fetched.
+    """
+    def is_closed(week: int) -> bool:
+        return cache_dir is not None and closed_before_week is not None and week < closed_before_week
+
+    def cache_closed_week(week: int, raw: bytes) -> None:
+        try:
+            _write_cached_scoreboard(cache_dir, week, raw)
+        except OSError as e:
+            print(f"[WARN] Could not cache scoreboard for week {week}: {e}")
+
+    results: Dict[int, Any] = {}
+    if not refresh:
+        for week in weeks:
+            if is_closed(week):
+                cached = _read_cached_scoreboard(cache_dir, week)
+                if cached is not None:
+                    results[week] = (*cached, None)
+    if results:
+        print(f"[INFO] Using cached scoreboards for {len(results)} completed week(s).")
+
+    if not refresh and cache_dir is not None and max_cache_age_hours > 0:
+        n_recent = 0
+        for week in weeks:
+            if week not in results:
+                recent = _read_recent_snapshot(cache_dir, week, max_cache_age_hours * 3600)
+                if recent is not None:
+                    results[week] = recent
+                    n_recent += 1
+                    if is_closed(week):
+                        cache_closed_week(week, recent[0])
+        if n_recent:
+            print(f"[INFO] Reusing raw snapshots younger than {max_cache_age_hours:g}h for {n_recent} week(s).")
+
+    to_fetch = [w for w in weeks if w not in results]
+    if not to_fetch:
+        return results
+
+    sess = get_session()
+
+    def fetch_one(week: int) -> Any:
+        try:
+            fetched = _fetch_scoreboard_week(league_key, week, sess)
+        except Exception as e:
+            return e
+        if is_closed(week):
+            cache_closed_week(week, fetched[0])
+        return (*fetched, None)
+
+    # Requests spend nearly all their time waiting on Yahoo, so threads overlap well.
+    workers = max(1, min(max_workers, len(to_fetch)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results.update(zip(to_fetch, pool.map(fetch_one, to_fetch)))
+    return results
+
+
+# ---------------- JSON helpers ----------------
+
+
+def _read_json(path: Path) -> Any:
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with path.open("r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _json_bytes(data: Any, pretty: bool, sort_keys: bool = False) -> bytes:
+    """Serialize JSON as UTF-8 (non-ASCII kept as-is), using orjson when available."""
+    if orjson is not None:
+        option = (orjson.OPT_INDENT_2 if pretty else 0) | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(data, option=option)
+    return json.dumps(data, ensure_ascii=False, indent=2 if pretty else None, sort_keys=sort_keys).encode("utf-8")
+
+
+def _write_json(
+    path: Path, data: Any, pretty: bool, sort_keys: bool = False, compress: bool = False
+) -> str:
+    """
+    Write JSON to ``path``; with ``compress`` the bytes are gzipped (level 1, favoring speed).
+
+    Returns the sha256 of the bytes written, so the manifest need not re-read the file.
+    """
+    return _write_bytes(path, _json_bytes(data, pretty, sort_keys), compress)
+
+
+def _write_bytes(path: Path, buf: bytes, compress: bool = False) -> str:
+    """Write ``buf`` (gzipped with ``compress``) and return the sha256 of what was written."""
+    if compress:
+        buf = gzip.compress(buf, compresslevel=1)
+    path.write_bytes(buf)
+    return hashlib.sha256(buf).hexdigest()
 
 
 # ---------------- league_dump context loading ----------------
 
 
-@dataclass
+@dataclass(slots=True)
 class LeagueContext:
     league_key: str
     league_info: Dict[str, Any]
@@ -107,8 +304,7 @@ def _load_latest_league_dump(league_key: str) -> LeagueContext:
         print("        Run league_dump first, then re-run standings_dump.")
         raise SystemExit(1)
 
-    with latest_path.open("r", encoding="utf-8") as f:
-        latest = json.load(f)
+    latest = _read_json(latest_path)
 
     ld = latest.get("league_dump")
     if not ld or "processed" not in ld:
@@ -124,8 +320,7 @@ def _load_latest_league_dump(league_key: str) -> LeagueContext:
         print("        Re-run league_dump for this league, then re-run standings_dump.")
         raise SystemExit(1)
 
-    with processed_path.open("r", encoding="utf-8") as f:
-        payload = json.load(f)
+    payload = _read_json(processed_path)
 
     league_info = payload.get("league_info") or {}
     teams = payload.get("teams") or []
@@ -142,7 +337,7 @@ def _load_latest_league_dump(league_key: str) -> LeagueContext:
 # ---------------- paths + manifest helpers ----------------
 
 
-@dataclass
+@dataclass(slots=True)
 class StandingsPaths:
     league_key: str
     root: Path
@@ -180,10 +375,18 @@ def _prepare_standings_dirs(league_key: str) -> StandingsPaths:
     )
 
 
+def _rel_posix(path: Path, root: str) -> str:
+    """League-root-relative POSIX path; ``root`` is the str of the league root."""
+    return os.path.relpath(path, root).replace(os.sep, "/")
+
+
 def _sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
     with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
+        # Python 3.11+: hashed in C with the GIL released.
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        h = hashlib.sha256()
+        for chunk in iter(lambda: f.read(1 << 20), b""):
             h.update(chunk)
     return h.hexdigest()
 
@@ -195,16 +398,25 @@ def _build_manifest_dict(
     run_ts: RunTimestamps,
     cli_args: Dict[str, Any],
     produced_paths: List[Path],
+    digests: Optional[Dict[Path, str]] = None,
 ) -> Dict[str, Any]:
+    """
+    ``digests`` holds sha256 values computed while the files were written;
+    any produced file missing from it is hashed from disk.
+    """
     files: Dict[str, Dict[str, Any]] = {}
+    digests = digests or {}
 
-    for abs_path in produced_paths:
-        # Normalize to league-root-relative POSIX paths
-        rel = abs_path.relative_to(paths.root).as_posix()
+    # Normalize to league-root-relative POSIX paths, inserted in sorted order so
+    # the manifest's largest dict is already ordered for the sort_keys write.
+    root_str = str(paths.root)
+    rel_paths = sorted((_rel_posix(abs_path, root_str), abs_path) for abs_path in produced_paths)
+    for rel, abs_path in rel_paths:
         stat = abs_path.stat()
+        sha256 = digests.get(abs_path)
         files[rel] = {
             "size_bytes": stat.st_size,
-            "sha256": _sha256_file(abs_path),
+            "sha256": sha256 if sha256 is not None else _sha256_file(abs_path),
         }
 
     return {
@@ -220,8 +432,7 @@ def _build_manifest_dict(
 
 def _write_manifest(paths: StandingsPaths, run_ts: RunTimestamps, manifest_data: Dict[str, Any]) -> Path:
     out_path = paths.manifest_dir / f"manifest.{run_ts.iso_stamp}.json"
-    with out_path.open("w", encoding="utf-8") as f:
-        json.dump(manifest_data, f, indent=2, sort_keys=True)
+    _write_json(out_path, manifest_data, pretty=True, sort_keys=True)
     return out_path
 
 
@@ -232,15 +443,16 @@ def _update_latest(
     weekly_rel: str,
     summary_rel: str,
     excel_rel: Optional[str],
-) -> Path:
+) -> Tuple[Path, str]:
     """
     Update _meta/latest.json with a 'standings_dump' block, preserving other modules' keys.
+
+    Returns the path and the sha256 of the bytes written.
     """
     latest_path = paths.meta_dir / "latest.json"
 
     if latest_path.exists():
-        with latest_path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _read_json(latest_path)
     else:
         data = {"league_key": paths.league_key}
 
@@ -255,19 +467,40 @@ def _update_latest(
     data["_updated_unix"] = run_ts.unix
     data["_updated_iso_utc"] = run_ts.iso_utc
 
-    with latest_path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, sort_keys=True)
+    sha256 = _write_json(latest_path, data, pretty=True, sort_keys=True)
 
-    return latest_path
+    return latest_path, sha256
 
 
 # ---------------- scoreboard parsing ----------------
 
+# Fixed paths into the Yahoo scoreboard JSON; ints index lists, strs index dicts.
+_SCOREBOARD_PTR = ("fantasy_content", "league", -1, "scoreboard")
+_MATCHUPS_PTR = ("0", "matchups")
+_TEAMS_PTR = ("0", "teams")
+
+
+def _at_pointer(node: Any, path: Tuple[Any, ...]) -> Any:
+    """
+    Follow ``path`` from ``node`` (JSON Pointer style); None if any step is missing.
+    """
+    try:
+        for key in path:
+            node = node[key]
+    except (KeyError, IndexError, TypeError):
+        return None
+    return node
+
 
 def _get_scoreboard_node(payload: dict) -> Optional[dict]:
     """
     Given a scoreboard payload, return the "scoreboard" node or None if absent.
     """
+    # Usual shape: the scoreboard is the last entry of the league list.
+    node = _at_pointer(payload, _SCOREBOARD_PTR)
+    if isinstance(node, dict):
+        return node
+
     fc = payload.get("fantasy_content") or {}
     league_node = fc.get("league")
 
@@ -288,13 +521,8 @@ def _iter_matchups(scoreboard_node: dict) -> Iterable[dict]:
     if not scoreboard_node:
         return
 
-    container = None
-    if "0" in scoreboard_node:
-        # usual shape: {"week": "N", "0": {"matchups": {...}}}
-        node0 = scoreboard_node["0"]
-        if isinstance(node0, dict):
-            container = node0.get("matchups")
-
+    # usual shape: {"week": "N", "0": {"matchups": {...}}}
+    container = _at_pointer(scoreboard_node, _MATCHUPS_PTR)
     if not isinstance(container, dict):
         return
 
@@ -320,6 +548,37 @@ def _flatten_team_core_list(core_list: List[Any]) -> Dict[str, Any]:
     return flat
 
 
+@dataclass(slots=True)
+class WeeklyRow:
+    """One team's result for one week (two per matchup)."""
+
+    week: int
+    team_key: str
+    opponent_key: str
+    prev_opponent_key: Optional[str]
+    is_playoffs: bool
+    is_consolation: bool
+    categories: Dict[str, float]  # {stat_id: value}
+    wins: int
+    losses: int
+    ties: int
+    team_points: Optional[float]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize in the weekly.<ISO>.json row shape."""
+        return {
+            "week": self.week,
+            "team_key": self.team_key,
+            "opponent_key": self.opponent_key,
+            "prev_opponent_key": self.prev_opponent_key,
+            "is_playoffs": self.is_playoffs,
+            "is_consolation": self.is_consolation,
+            "categories": self.categories,
+            "result": {"wins": self.wins, "losses": self.losses, "ties": self.ties},
+            "team_points": self.team_points,
+        }
+
+
 def _parse_team_node(team_node: List[Any]) -> Tuple[str, Dict[str, Any], Dict[str, float], Optional[float]]:
     """
     Parse a Yahoo scoreboard "team" array into:
@@ -332,7 +591,9 @@ def _parse_team_node(team_node: List[Any]) -> Tuple[str, Dict[str, Any], Dict[st
     core_list = team_node[0]
     flat = _flatten_team_core_list(core_list)
 
-    team_key = str(flat.get("team_key") or "")
+    # JSON strings decode to str, so keys taken from the payload need no str() coercion.
+    # team_key/stat_id repeat across every week; interning collapses the copies.
+    team_key = intern_value(flat.get("team_key") or "")
     team_meta = {
         "team_key": team_key,
         "team_id": flat.get("team_id"),
@@ -356,12 +617,12 @@ def _parse_team_node(team_node: List[Any]) -> Tuple[str, Dict[str, Any], Dict[st
             if not isinstance(s, dict):
                 continue
             st = s.get("stat") or {}
-            stat_id = str(st.get("stat_id"))
+            stat_id = st.get("stat_id")
             value = st.get("value")
-            if value is None or stat_id == "None":
+            if value is None or stat_id is None:
                 continue
             try:
-                stats_by_id[stat_id] = float(value)
+                stats_by_id[intern_value(stat_id)] = float(value)
             except (TypeError, ValueError):
                 # keep as best-effort; don't crash on weird values
                 continue
@@ -386,13 +647,12 @@ def _build_stat_winners_map(matchup: dict) -> Dict[str, Dict[str, Any]]:
         if not isinstance(entry, dict):
             continue
         sw = entry.get("stat_winner") or {}
-        stat_id = str(sw.get("stat_id"))
-        if not stat_id or stat_id == "None":
+        stat_id = sw.get("stat_id")
+        if not stat_id:
             continue
         is_tied = bool(sw.get("is_tied"))
-        winner_team_key = sw.get("winner_team_key")
-        out[stat_id] = {
-            "winner_team_key": str(winner_team_key) if winner_team_key else None,
+        out[intern_value(stat_id)] = {
+            "winner_team_key": intern_value(sw.get("winner_team_key") or None),
             "is_tied": is_tied,
         }
     return out
@@ -400,10 +660,10 @@ def _build_stat_winners_map(matchup: dict) -> Dict[str, Dict[str, Any]]:
 
 def _compute_weekly_results_for_matchup(
     matchup: dict,
-    scoring_stat_ids: List[str],
+    scoring_stat_ids: Tuple[str, ...],
 ) -> Tuple[
     Dict[str, Any],  # matchup summary
-    List[Dict[str, Any]],  # per-team weekly rows (without prev_opponent)
+    List[WeeklyRow],  # per-team weekly rows (without prev_opponent)
 ]:
     """
     Compute per-matchup summary and per-team weekly rows, using scoreboard data.
@@ -414,9 +674,9 @@ def _compute_weekly_results_for_matchup(
     is_playoffs = str(matchup.get("is_playoffs") or "0") == "1"
     is_consolation = str(matchup.get("is_consolation") or "0") == "1"
     is_tied = bool(matchup.get("is_tied"))
-    winner_team_key = str(matchup.get("winner_team_key") or "") or None
+    winner_team_key = matchup.get("winner_team_key") or None
 
-    teams_container = matchup.get("0", {}).get("teams")
+    teams_container = _at_pointer(matchup, _TEAMS_PTR)
     if not isinstance(teams_container, dict) or "count" not in teams_container:
         return {}, []
 
@@ -463,83 +723,80 @@ def _compute_weekly_results_for_matchup(
         "team_b_points": team_b.get("team_points"),
     }
 
-    # H2H category wins/losses/ties per team, based on stat_winners.
+    # H2H category wins/losses/ties per team, based on stat_winners. Plain int
+    # counters; the per-team result dicts are only built for the weekly rows.
     sw_map = _build_stat_winners_map(matchup)
-    results: Dict[str, Dict[str, int]] = {
-        team_a["team_key"]: {"wins": 0, "losses": 0, "ties": 0},
-        team_b["team_key"]: {"wins": 0, "losses": 0, "ties": 0},
-    }
+    team_a_key = team_a["team_key"]
+    team_b_key = team_b["team_key"]
+    a_wins = b_wins = ties = 0
 
+    sw_get = sw_map.get
     for stat_id in scoring_stat_ids:
-        entry = sw_map.get(stat_id)
-        if not entry:
-            # Yahoo usually includes all scoring stats in stat_winners, but if not,
-            # treat missing as a tie to be safe.
-            results[team_a["team_key"]]["ties"] += 1
-            results[team_b["team_key"]]["ties"] += 1
-            continue
-
-        if entry.get("is_tied"):
-            results[team_a["team_key"]]["ties"] += 1
-            results[team_b["team_key"]]["ties"] += 1
-            continue
-
-        winner_key = entry.get("winner_team_key")
-        if not winner_key or winner_key not in results:
-            # Unknown winner; skip this stat rather than crashing.
-            continue
-
-        loser_key = team_b["team_key"] if winner_key == team_a["team_key"] else team_a["team_key"]
-        results[winner_key]["wins"] += 1
-        results[loser_key]["losses"] += 1
+        entry = sw_get(stat_id)
+        # Yahoo usually includes all scoring stats in stat_winners, but if not,
+        # treat missing as a tie to be safe.
+        if not entry or entry["is_tied"]:
+            ties += 1
+        elif entry["winner_team_key"] == team_a_key:
+            a_wins += 1
+        elif entry["winner_team_key"] == team_b_key:
+            b_wins += 1
+        # Unknown winner; skip this stat rather than crashing.
 
     # Build weekly rows (prev_opponent filled later).
-    weekly_rows: List[Dict[str, Any]] = []
-    for home, away in ((team_a, team_b), (team_b, team_a)):
-        weekly_rows.append(
-            {
-                "week": week_num,
-                "team_key": home["team_key"],
-                "opponent_key": away["team_key"],
-                "prev_opponent_key": None,  # filled after all weeks are loaded
-                "is_playoffs": is_playoffs,
-                "is_consolation": is_consolation,
-                "categories": home["stats"],  # {stat_id: value}
-                "result": results[home["team_key"]],
-                "team_points": home.get("team_points"),
-            }
-        )
+    weekly_rows = [
+        WeeklyRow(
+            week=week_num,
+            team_key=team_a_key,
+            opponent_key=team_b_key,
+            prev_opponent_key=None,  # filled after all weeks are loaded
+            is_playoffs=is_playoffs,
+            is_consolation=is_consolation,
+            categories=team_a["stats"],
+            wins=a_wins,
+            losses=b_wins,
+            ties=ties,
+            team_points=team_a.get("team_points"),
+        ),
+        WeeklyRow(
+            week=week_num,
+            team_key=team_b_key,
+            opponent_key=team_a_key,
+            prev_opponent_key=None,
+            is_playoffs=is_playoffs,
+            is_consolation=is_consolation,
+            categories=team_b["stats"],
+            wins=b_wins,
+            losses=a_wins,
+            ties=ties,
+            team_points=team_b.get("team_points"),
+        ),
+    ]
 
     return matchup_summary, weekly_rows
 
 
-def _backfill_prev_opponents(weekly_rows: List[Dict[str, Any]]) -> None:
+def _backfill_prev_opponents(weekly_rows: List[WeeklyRow]) -> None:
     """
     For each (team, week) row, set prev_opponent_key based on the prior week's opponent.
+
+    Rows carry an int week (set in _compute_weekly_results_for_matchup) and
+    are updated in place while walking each team's rows in week order.
     """
-    by_team: Dict[str, List[Tuple[int, str]]] = {}
+    by_team: Dict[str, List[WeeklyRow]] = {}
     for row in weekly_rows:
-        team_key = row.get("team_key")
-        week = int(row.get("week"))
-        opp = row.get("opponent_key")
+        team_key = row.team_key
         if not team_key:
             continue
-        by_team.setdefault(team_key, []).append((week, opp))
+        by_team.setdefault(team_key, []).append(row)
 
-    # For each team, sort by week and compute previous opponent.
-    prev_map: Dict[Tuple[str, int], Optional[str]] = {}
-    for team_key, items in by_team.items():
-        items.sort(key=lambda x: x[0])
+    get_week = operator.attrgetter("week")
+    for rows in by_team.values():
+        rows.sort(key=get_week)
         prev_opp: Optional[str] = None
-        for week, opp in items:
-            prev_map[(team_key, week)] = prev_opp
-            prev_opp = opp
-
-    # Apply back to rows
-    for row in weekly_rows:
-        team_key = row.get("team_key")
-        week = int(row.get("week"))
-        row["prev_opponent_key"] = prev_map.get((team_key, week))
+        for row in rows:
+            row.prev_opponent_key = prev_opp
+            prev_opp = row.opponent_key
 
 
 # ---------------- summary aggregation ----------------
@@ -547,7 +804,7 @@ def _backfill_prev_opponents(weekly_rows: List[Dict[str, Any]]) -> None:
 
 def _aggregate_summary(
     league_key: str,
-    weekly_rows: List[Dict[str, Any]],
+    weekly_rows: List[WeeklyRow],
 ) -> Dict[str, Any]:
     """
     Aggregate per-team regular-season and playoff summaries from weekly rows.
@@ -561,9 +818,8 @@ def _aggregate_summary(
     }
 
     for row in weekly_rows:
-        is_playoffs = bool(row.get("is_playoffs"))
-        bucket_name = "playoffs" if is_playoffs else "regular"
-        team_key = str(row.get("team_key") or "")
+        bucket_name = "playoffs" if row.is_playoffs else "regular"
+        team_key = row.team_key
         if not team_key:
             continue
 
@@ -579,31 +835,32 @@ def _aggregate_summary(
         b["weeks_played"] += 1
 
         # Sum categories
-        cats = row.get("categories") or {}
-        for stat_id, value in cats.items():
+        for stat_id, value in row.categories.items():
             try:
                 v = float(value)
             except (TypeError, ValueError):
                 continue
-            b["totals"][str(stat_id)] += v
+            b["totals"][stat_id] += v
 
-        # Sum H2H results (category wins/losses/ties per week)
-        res = row.get("result") or {}
-        for k in ("wins", "losses", "ties"):
-            try:
-                b["h2h_record"][k] += int(res.get(k) or 0)
-            except (TypeError, ValueError):
-                continue
+        # Sum H2H results (category wins/losses/ties per week).
+        rec = b["h2h_record"]
+        rec["wins"] += row.wins
+        rec["losses"] += row.losses
+        rec["ties"] += row.ties
 
-    def build_per_team(bucket: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def build_section(bucket: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], Dict[str, List[Dict[str, Any]]]]:
+        # One walk over the bucket emits the per-team entries and collects
+        # (team_key, total) pairs for the per-stat rankings.
         per_team: List[Dict[str, Any]] = []
+        by_stat: Dict[str, List[Tuple[str, float]]] = {}
         for team_key, data in bucket.items():
             weeks_played = data["weeks_played"] or 0
-            totals = {sid: float(v) for sid, v in data["totals"].items()}
+            totals = dict(data["totals"])
             avg_per_week: Dict[str, float] = {}
-            if weeks_played > 0:
-                for sid, total in totals.items():
+            for sid, total in totals.items():
+                if weeks_played > 0:
                     avg_per_week[sid] = total / weeks_played
+                by_stat.setdefault(sid, []).append((team_key, total))
 
             per_team.append(
                 {
@@ -616,45 +873,31 @@ def _aggregate_summary(
                     "power_rank": None,
                 }
             )
-        return per_team
-
-    def build_per_stat_ranks(bucket: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
-        # For each stat_id, build a ranking across teams based on totals.
-        by_stat: Dict[str, List[Tuple[str, float]]] = {}
-        for team_key, data in bucket.items():
-            totals = data["totals"]
-            for sid, total in totals.items():
-                by_stat.setdefault(str(sid), []).append((team_key, float(total)))
 
         ranks_out: Dict[str, List[Dict[str, Any]]] = {}
         for sid, pairs in by_stat.items():
             # Higher is better for now; we can add per-stat direction later.
             pairs.sort(key=lambda x: x[1], reverse=True)
-            ranked: List[Dict[str, Any]] = []
-            rank = 1
-            for team_key, value in pairs:
-                ranked.append(
-                    {
-                        "team_key": team_key,
-                        "rank": rank,
-                        "value": value,
-                    }
-                )
-                rank += 1
-            ranks_out[sid] = ranked
-
-        return ranks_out
+            ranks_out[sid] = [
+                {"team_key": team_key, "rank": rank, "value": value}
+                for rank, (team_key, value) in enumerate(pairs, start=1)
+            ]
+
+        return per_team, ranks_out
 
     regular_bucket = buckets["regular"]
     playoff_bucket = buckets["playoffs"]
 
+    regular_per_team, regular_ranks = build_section(regular_bucket)
+    playoff_per_team, playoff_ranks = build_section(playoff_bucket)
+
     regular_section = {
-        "per_team": build_per_team(regular_bucket),
-        "per_stat_ranks": build_per_stat_ranks(regular_bucket),
+        "per_team": regular_per_team,
+        "per_stat_ranks": regular_ranks,
     }
     playoffs_section = {
-        "per_team": build_per_team(playoff_bucket),
-        "per_stat_ranks": build_per_stat_ranks(playoff_bucket),
+        "per_team": playoff_per_team,
+        "per_stat_ranks": playoff_ranks,
         # Bracket / rounds reconstruction can be added later.
         "rounds": [],
         "final_standings": [],
@@ -688,24 +931,34 @@ def _to_num(val: Any) -> int | float | str:
 
 def _to_excel(
     league_ctx: LeagueContext,
-    weekly_rows: List[dict],
+    weekly_rows: List[WeeklyRow],
     matchup_summaries: List[Dict[str, Any]],
     xlsx_path: Path,
     run_ts: Optional[RunTimestamps] = None,
-) -> None:
+) -> str:
     """
     Write an Excel workbook summarizing matchups, weekly totals, and summaries.
+
+    Returns the sha256 of the saved workbook.
     """
     from collections import defaultdict
 
     from openpyxl import Workbook
     from openpyxl.utils import get_column_letter
 
-    wb = Workbook()
+    # Write-only mode streams rows straight to the sheet XML. Sheet settings
+    # (freeze panes, filters, widths) must be applied before the first row,
+    # so filter ranges are sized from the row counts known up front.
+    wb = Workbook(write_only=True)
+
+    def setup_sheet(ws: Any, n_cols: int, n_rows: int, widths: Dict[int, float]) -> None:
+        ws.freeze_panes = "A2"
+        ws.auto_filter.ref = f"A1:{get_column_letter(n_cols)}{n_rows}"
+        for col_idx, width in widths.items():
+            ws.column_dimensions[get_column_letter(col_idx)].width = width
 
     # 1) Matchups sheet
-    ws_matchups = wb.active
-    ws_matchups.title = "Matchups"
+    ws_matchups = wb.create_sheet("Matchups")
     headers_m = [
         "week",
         "is_playoffs",
@@ -720,6 +973,12 @@ def _to_excel(
         "winner_team_name",
         "is_tied",
     ]
+    setup_sheet(
+        ws_matchups,
+        n_cols=len(headers_m),
+        n_rows=len(matchup_summaries) + 1,
+        widths={i: 16 for i in range(1, len(headers_m) + 1)},
+    )
     ws_matchups.append(headers_m)
 
     team_name_by_key = {str(t.get("team_key")): t.get("name") for t in league_ctx.teams}
@@ -745,11 +1004,6 @@ def _to_excel(
             ]
         )
 
-    ws_matchups.freeze_panes = "A2"
-    ws_matchups.auto_filter.ref = f"A1:{get_column_letter(ws_matchups.max_column)}{ws_matchups.max_row}"
-    for col_idx in range(1, ws_matchups.max_column + 1):
-        ws_matchups.column_dimensions[get_column_letter(col_idx)].width = 16
-
     # 2) Weekly totals sheet
     ws_weekly = wb.create_sheet("WeeklyTotals")
 
@@ -766,7 +1020,7 @@ def _to_excel(
     # Some leagues might have additional stats present in weekly rows only.
     present_ids = set()
     for row in weekly_rows:
-        for sid in (row.get("categories") or {}).keys():
+        for sid in row.categories:
             present_ids.add(str(sid))
     for sid in sorted(present_ids):
         if sid not in stat_id_order:
@@ -793,45 +1047,45 @@ def _to_excel(
         headers_w.append(stat_labels.get(sid, sid))
     headers_w.extend(["cats_wins", "cats_losses", "cats_ties", "team_points"])
 
+    # Identity columns are wider than the stat columns (9+).
+    setup_sheet(
+        ws_weekly,
+        n_cols=len(headers_w),
+        n_rows=len(weekly_rows) + 1,
+        widths={i: (18 if i < 9 else 12) for i in range(1, len(headers_w) + 1)},
+    )
     ws_weekly.append(headers_w)
 
-    for row in sorted(weekly_rows, key=lambda x: (x.get("week"), x.get("team_key", ""))):
-        team_key = str(row.get("team_key") or "")
-        opp_key = str(row.get("opponent_key") or "")
-        prev_opp = row.get("prev_opponent_key")
-        cats = row.get("categories") or {}
-        res = row.get("result") or {}
+    # Hot loop: iterate a tuple of stat ids and bind lookups to locals.
+    stat_ids = tuple(stat_id_order)
+    team_name = team_name_by_key.get
+    to_num = _to_num
+
+    for row in sorted(weekly_rows, key=operator.attrgetter("week", "team_key")):
+        team_key = row.team_key
+        opp_key = row.opponent_key
+        cats = row.categories
         out_row = [
-            row.get("week"),
-            bool(row.get("is_playoffs")),
-            bool(row.get("is_consolation")),
+            row.week,
+            row.is_playoffs,
+            row.is_consolation,
             team_key,
-            team_name_by_key.get(team_key, team_key),
+            team_name(team_key, team_key),
             opp_key,
-            team_name_by_key.get(opp_key, opp_key),
-            prev_opp,
+            team_name(opp_key, opp_key),
+            row.prev_opponent_key,
         ]
-        for sid in stat_id_order:
-            val = cats.get(sid)
-            out_row.append(_to_num(val))
+        out_row.extend([to_num(cats.get(sid)) for sid in stat_ids])
         out_row.extend(
             [
-                _to_num(res.get("wins")),
-                _to_num(res.get("losses")),
-                _to_num(res.get("ties")),
-                _to_num(row.get("team_points")),
+                to_num(row.wins),
+                to_num(row.losses),
+                to_num(row.ties),
+                to_num(row.team_points),
             ]
         )
         ws_weekly.append(out_row)
 
-    ws_weekly.freeze_panes = "A2"
-    ws_weekly.auto_filter.ref = f"A1:{get_column_letter(ws_weekly.max_column)}{ws_weekly.max_row}"
-    for col_idx in range(1, 9):
-        ws_weekly.column_dimensions[get_column_letter(col_idx)].width = 18
-    # Stat columns
-    for col_idx in range(9, ws_weekly.max_column + 1):
-        ws_weekly.column_dimensions[get_column_letter(col_idx)].width = 12
-
     # 3) Summary sheets (regular + playoffs) – optional, but useful.
     summary = _aggregate_summary(league_ctx.league_key, weekly_rows)
 
@@ -841,43 +1095,42 @@ def _to_excel(
         per_stat_ranks = section.get("per_stat_ranks") or {}
 
         ws = wb.create_sheet(name)
-        # Header: team-level aggregates
-        ws.append(["team_key", "team_name", "weeks_played", "wins", "losses", "ties", "power_rank"])
-        for row in per_team:
-            team_key = row.get("team_key")
-            rec = row.get("h2h_record") or {}
-            ws.append(
-                [
-                    team_key,
-                    team_name_by_key.get(str(team_key), team_key),
-                    row.get("weeks_played"),
-                    rec.get("wins"),
-                    rec.get("losses"),
-                    rec.get("ties"),
-                    row.get("power_rank"),
-                ]
+        # Header: team-level aggregates (the filter covers this first table only)
+        headers_s = ["team_key", "team_name", "weeks_played", "wins", "losses", "ties", "power_rank"]
+        setup_sheet(
+            ws,
+            n_cols=len(headers_s),
+            n_rows=len(per_team) + 1,
+            widths={i: 16 for i in range(1, len(headers_s) + 1)},
+        )
+        append = ws.append
+        append(headers_s)
+        team_rows = (
+            (
+                row["team_key"],
+                team_name(row["team_key"], row["team_key"]),
+                row["weeks_played"],
+                row["h2h_record"]["wins"],
+                row["h2h_record"]["losses"],
+                row["h2h_record"]["ties"],
+                row["power_rank"],
             )
-        ws.freeze_panes = "A2"
-        ws.auto_filter.ref = f"A1:{get_column_letter(ws.max_column)}{ws.max_row}"
-        for col_idx in range(1, ws.max_column + 1):
-            ws.column_dimensions[get_column_letter(col_idx)].width = 16
+            for row in per_team
+        )
+        for r in team_rows:
+            append(r)
 
         # Optional: second table with per-stat ranks, appended below a blank row.
         if per_stat_ranks:
-            ws.append([])
-            ws.append(["stat_id", "rank", "team_key", "team_name", "value"])
-            for sid, entries in per_stat_ranks.items():
-                for entry in entries:
-                    tkey = entry.get("team_key")
-                    ws.append(
-                        [
-                            sid,
-                            entry.get("rank"),
-                            tkey,
-                            team_name_by_key.get(str(tkey), tkey),
-                            entry.get("value"),
-                        ]
-                    )
+            append([])
+            append(["stat_id", "rank", "team_key", "team_name", "value"])
+            rank_rows = (
+                (sid, e["rank"], e["team_key"], team_name(e["team_key"], e["team_key"]), e["value"])
+                for sid, entries in per_stat_ranks.items()
+                for e in entries
+            )
+            for r in rank_rows:
+                append(r)
 
     write_summary_sheet("RegularSummary", "regular_season")
     write_summary_sheet("PlayoffSummary", "playoffs")
@@ -890,8 +1143,13 @@ def _to_excel(
         ws_run.append(["_generated_iso_local", run_ts.iso_local])
         ws_run.append(["_generated_excel_serial", run_ts.excel_serial])
 
+    # Save into memory so the bytes can be hashed on their way to disk.
+    buf = io.BytesIO()
+    wb.save(buf)
+    data = buf.getvalue()
     xlsx_path.parent.mkdir(parents=True, exist_ok=True)
-    wb.save(xlsx_path)
+    xlsx_path.write_bytes(data)
+    return hashlib.sha256(data).hexdigest()
 
 
 # ---------------- CLI + main ----------------
@@ -909,6 +1167,34 @@ def _parse_args() -> argparse.Namespace:
     p.add_argument("--pretty", action="store_true", help="Pretty-print JSON outputs")
     p.add_argument("--to-excel", action="store_true", help="Also write an Excel workbook")
 
+    p.add_argument(
+        "--compress-raw",
+        action="store_true",
+        help="Write raw scoreboard snapshots gzip-compressed (raw/scoreboard.wkNNN.<ISO>.json.gz)",
+    )
+
+    p.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Number of weekly scoreboards to fetch in parallel (default: {DEFAULT_CONCURRENCY})",
+    )
+
+    p.add_argument(
+        "--refresh",
+        action="store_true",
+        help=(
+            "Re-fetch completed weeks instead of using cached scoreboards "
+            "(needed to pick up stat corrections Yahoo makes after a week is cached)"
+        ),
+    )
+    p.add_argument(
+        "--max-cache-age-hours",
+        type=float,
+        default=0,
+        help="Reuse raw scoreboard snapshots younger than this many hours instead of re-fetching (default: 0, disabled)",
+    )
+
     p.add_argument("--since-week", type=int, help="First week to include (defaults to league start_week)")
     p.add_argument("--through-week", type=int, help="Last week to include (defaults to league end_week)")
 
@@ -938,6 +1224,17 @@ def _parse_args() -> argparse.Namespace:
     return p.parse_args()
 
 
+_TRUE_STRINGS = frozenset({"1", "true", "True"})
+
+
+def _is_display_only(cat: Dict[str, Any]) -> bool:
+    """True for stat categories Yahoo flags with is_only_display_stat."""
+    raw = cat.get("is_only_display_stat")
+    if raw is True or (type(raw) is int and raw == 1):
+        return True
+    return isinstance(raw, str) and raw.strip() in _TRUE_STRINGS
+
+
 def _resolve_league_key(args: argparse.Namespace) -> str:
     if args.league_key:
         return args.league_key
@@ -994,67 +1291,107 @@ def main() -> None:
     # Determine which stat_ids are scored (exclude "only_display" stats).
     scoring = league_ctx.scoring or {}
     stat_categories = scoring.get("stat_categories") or []
-    scoring_stat_ids: List[str] = []
-    for cat in stat_categories:
-        sid = cat.get("stat_id")
-        if sid is None:
-            continue
-        is_only_display = str(cat.get("is_only_display_stat") or "").strip()
-        if is_only_display in ("1", "true", "True"):
-            # Skip display-only stats (e.g., raw shots against where GAA is used).
-            continue
-        scoring_stat_ids.append(str(sid))
+    # Skip display-only stats (e.g., raw shots against where GAA is used).
+    # Invariant across every matchup, so freeze it once.
+    scoring_stat_ids = tuple(
+        str(cat["stat_id"])
+        for cat in stat_categories
+        if cat.get("stat_id") is not None and not _is_display_only(cat)
+    )
 
     raw_paths: List[Path] = []
+    # sha256 of each produced file, recorded as it is written (for the manifest).
+    digests: Dict[Path, str] = {}
     matchup_summaries: List[Dict[str, Any]] = []
-    weekly_rows: List[Dict[str, Any]] = []
+    weekly_rows: List[WeeklyRow] = []
+
+    # Pull all scoreboards up front (concurrently), then process weeks in order.
+    weeks = list(range(since_week, through_week + 1))
+    if not include_playoffs and playoff_start_week is not None:
+        # Playoff weeks would only be discarded below; don't fetch them at all.
+        # The per-week playoff check stays as a safety net.
+        skipped = [w for w in weeks if w >= playoff_start_week]
+        if skipped:
+            print(f"[INFO] --regular-season-only: not fetching playoff weeks {skipped[0]}-{skipped[-1]}.")
+            weeks = [w for w in weeks if w < playoff_start_week]
+    try:
+        current_week: Optional[int] = int(league_info.get("current_week"))
+    except (TypeError, ValueError):
+        current_week = None
+    # Only weeks past the stat-correction window are cached. A stale league_dump
+    # can only under-report current_week, which caches fewer weeks, not more.
+    payloads = _fetch_all_weeks(
+        league_key,
+        weeks,
+        max_workers=args.concurrency,
+        cache_dir=paths.raw_dir,
+        closed_before_week=current_week - STAT_CORRECTION_GRACE_WEEKS if current_week is not None else None,
+        refresh=args.refresh,
+        max_cache_age_hours=args.max_cache_age_hours,
+    )
 
-    # Iterate weeks and pull scoreboard data.
-    for week in range(since_week, through_week + 1):
-        try:
-            payload = _fetch_scoreboard_week(league_key, week)
-        except Exception as e:
-            print(f"[WARN] Failed to fetch scoreboard for week {week}: {e}")
-            continue
+    # Raw snapshots are written on a small pool while the main thread parses.
+    with ThreadPoolExecutor(max_workers=2) as io_pool:
+        raw_writes: List[Tuple[int, Path, Any, Optional[float]]] = []
 
-        scoreboard_node = _get_scoreboard_node(payload)
-        if not scoreboard_node:
-            print(f"[INFO] No scoreboard available for week {week}; skipping.")
-            continue
+        for week in weeks:
+            fetched = payloads.pop(week)
+            if isinstance(fetched, Exception):
+                print(f"[WARN] Failed to fetch scoreboard for week {week}: {fetched}")
+                continue
+            raw_body, payload, fetched_at = fetched
 
-        # Raw snapshot for this week.
-        raw_path = paths.raw_dir / f"scoreboard.wk{week:03d}.{iso_stamp}.json"
-        with raw_path.open("w", encoding="utf-8") as f:
-            json.dump(payload, f, ensure_ascii=False, indent=2 if args.pretty else None)
-        raw_paths.append(raw_path)
-        print(f"Wrote raw scoreboard for week {week}: {raw_path}")
-
-        # Parse all matchups in this week.
-        week_matchups: List[Dict[str, Any]] = []
-        week_weekly_rows: List[Dict[str, Any]] = []
-        is_week_playoffs = False
-
-        for matchup in _iter_matchups(scoreboard_node):
-            summary, rows = _compute_weekly_results_for_matchup(matchup, scoring_stat_ids)
-            if not summary:
+            scoreboard_node = _get_scoreboard_node(payload)
+            if not scoreboard_node:
+                print(f"[INFO] No scoreboard available for week {week}; skipping.")
                 continue
-            week_matchups.append(summary)
-            week_weekly_rows.extend(rows)
-            if summary.get("is_playoffs"):
-                is_week_playoffs = True
-
-        # Apply playoff filters.
-        if is_week_playoffs and not include_playoffs:
-            print(f"[INFO] Week {week} is playoffs and --regular-season-only is active; skipping week.")
-            continue
 
-        if not week_matchups:
-            print(f"[INFO] No usable matchups parsed for week {week}; skipping.")
-            continue
+            # Raw snapshot for this week.
+            raw_suffix = ".json.gz" if args.compress_raw else ".json"
+            raw_path = paths.raw_dir / f"scoreboard.wk{week:03d}.{iso_stamp}{raw_suffix}"
+            if args.pretty:
+                fut = io_pool.submit(_write_json, raw_path, payload, pretty=True, compress=args.compress_raw)
+            else:
+                # Snapshot Yahoo's response body as-is; no re-encode of the parsed payload.
+                fut = io_pool.submit(_write_bytes, raw_path, raw_body, compress=args.compress_raw)
+            raw_writes.append((week, raw_path, fut, fetched_at))
+
+            # Parse all matchups in this week.
+            week_matchups: List[Dict[str, Any]] = []
+            week_weekly_rows: List[WeeklyRow] = []
+            is_week_playoffs = False
+
+            for matchup in _iter_matchups(scoreboard_node):
+                summary, rows = _compute_weekly_results_for_matchup(matchup, scoring_stat_ids)
+                if not summary:
+                    continue
+                week_matchups.append(summary)
+                week_weekly_rows.extend(rows)
+                if summary.get("is_playoffs"):
+                    is_week_playoffs = True
+
+            # Apply playoff filters.
+            if is_week_playoffs and not include_playoffs:
+                print(f"[INFO] Week {week} is playoffs and --regular-season-only is active; skipping week.")
+                continue
 
-        # Collect for this run.
-        matchup_summaries.extend(week_matchups)
-        weekly_rows.extend(week_weekly_rows)
+            if not week_matchups:
+                print(f"[INFO] No usable matchups parsed for week {week}; skipping.")
+                continue
+
+            # Collect for this run.
+            matchup_summaries.extend(week_matchups)
+            weekly_rows.extend(week_weekly_rows)
+
+        # Wait for the raw snapshots; result() re-raises any write error.
+        for week, raw_path, fut, fetched_at in raw_writes:
+            digests[raw_path] = fut.result()
+            if fetched_at is not None:
+                # Reused snapshot: keep its original fetch time so --max-cache-age-hours
+                # keeps measuring from the real fetch rather than from this copy.
+                os.utime(raw_path, (fetched_at, fetched_at))
+            raw_paths.append(raw_path)
+            print(f"Wrote raw scoreboard for week {week}: {raw_path}")
 
     if not weekly_rows:
         print("[ERROR] No weekly rows were produced; nothing to write.")
@@ -1064,81 +1401,81 @@ def main() -> None:
     _backfill_prev_opponents(weekly_rows)
 
     # Build processed JSON payloads.
-    matchups_payload = {
-        "league_key": league_key,
+    # Shared timestamp block for the three processed payloads.
+    generated_meta = {
         "_generated_unix": run_ts.unix,
         "_generated_iso_utc": run_ts.iso_utc,
         "_generated_iso_local": run_ts.iso_local,
-        "weeks": [],
     }
 
-    # Group matchup summaries by week.
-    from collections import defaultdict
+    matchups_payload = {
+        "league_key": league_key,
+        **generated_meta,
+        "weeks": [],
+    }
 
-    by_week: Dict[int, Dict[str, Any]] = defaultdict(lambda: {"matchups": []})
-    for ms in matchup_summaries:
-        w = int(ms.get("week"))
-        bw = by_week[w]
-        bw.setdefault("week", w)
-        bw.setdefault("week_start", ms.get("week_start"))
-        bw.setdefault("week_end", ms.get("week_end"))
-        # If any matchup is playoffs, treat week as playoffs.
-        if ms.get("is_playoffs"):
-            bw["is_playoffs"] = True
-        else:
-            bw.setdefault("is_playoffs", False)
-        bw["matchups"].append(ms)
-
-    for w in sorted(by_week.keys()):
-        matchups_payload["weeks"].append(by_week[w])
+    # Group matchup summaries by week. They were collected week by week in
+    # ascending order, so consecutive runs are already the groups.
+    for w, group in itertools.groupby(matchup_summaries, key=operator.itemgetter("week")):
+        items = list(group)
+        matchups_payload["weeks"].append(
+            {
+                "matchups": items,
+                "week": w,
+                "week_start": items[0].get("week_start"),
+                "week_end": items[0].get("week_end"),
+                # If any matchup is playoffs, treat week as playoffs.
+                "is_playoffs": any(ms.get("is_playoffs") for ms in items),
+            }
+        )
 
     weekly_payload = {
         "league_key": league_key,
-        "_generated_unix": run_ts.unix,
-        "_generated_iso_utc": run_ts.iso_utc,
-        "_generated_iso_local": run_ts.iso_local,
-        "rows": weekly_rows,
+        **generated_meta,
+        "rows": [row.to_dict() for row in weekly_rows],
     }
 
     summary_payload = _aggregate_summary(league_key, weekly_rows)
-    summary_payload["_generated_unix"] = run_ts.unix
-    summary_payload["_generated_iso_utc"] = run_ts.iso_utc
-    summary_payload["_generated_iso_local"] = run_ts.iso_local
+    summary_payload.update(generated_meta)
 
     # Write processed JSON files.
     matchups_path = paths.processed_dir / f"matchups.{iso_stamp}.json"
     weekly_path = paths.processed_dir / f"weekly.{iso_stamp}.json"
     summary_path = paths.processed_dir / f"summary.{iso_stamp}.json"
 
-    for path, payload in (
+    processed = (
         (matchups_path, matchups_payload),
         (weekly_path, weekly_payload),
         (summary_path, summary_payload),
-    ):
-        with path.open("w", encoding="utf-8") as f:
-            json.dump(payload, f, ensure_ascii=False, indent=2 if args.pretty else None)
+    )
+    # The three files are independent; overlap their disk writes.
+    with ThreadPoolExecutor(max_workers=len(processed)) as pool:
+        written = list(pool.map(lambda pp: _write_json(pp[0], pp[1], pretty=args.pretty), processed))
+    for (path, _payload), sha256 in zip(processed, written):
+        digests[path] = sha256
         print(f"Wrote processed: {path}")
 
-    produced_paths: List[Path] = []
-    produced_paths.extend(raw_paths)
-    produced_paths.extend([matchups_path, weekly_path, summary_path])
+    produced_paths: List[Path] = [*raw_paths, matchups_path, weekly_path, summary_path]
+    root_str = str(paths.root)
 
     # Optional Excel workbook
     if args.to_excel:
         week_range_label = f"wk{since_week:02d}-{through_week:02d}"
         excel_path = paths.excel_dir / f"standings.{week_range_label}.{iso_stamp}.xlsx"
-        _to_excel(league_ctx, weekly_rows, matchup_summaries, excel_path, run_ts=run_ts)
+        digests[excel_path] = _to_excel(league_ctx, weekly_rows, matchup_summaries, excel_path, run_ts=run_ts)
         print(f"Wrote Excel: {excel_path}")
         produced_paths.append(excel_path)
-        excel_rel: Optional[str] = excel_path.relative_to(paths.root).as_posix()
+        excel_rel: Optional[str] = _rel_posix(excel_path, root_str)
     else:
         excel_rel = None
 
     # Update _meta/latest.json for standings_dump.
-    matchups_rel = matchups_path.relative_to(paths.root).as_posix()
-    weekly_rel = weekly_path.relative_to(paths.root).as_posix()
-    summary_rel = summary_path.relative_to(paths.root).as_posix()
-    latest_path = _update_latest(paths, run_ts, matchups_rel, weekly_rel, summary_rel, excel_rel)
+    matchups_rel = _rel_posix(matchups_path, root_str)
+    weekly_rel = _rel_posix(weekly_path, root_str)
+    summary_rel = _rel_posix(summary_path, root_str)
+    latest_path, digests[latest_path] = _update_latest(
+        paths, run_ts, matchups_rel, weekly_rel, summary_rel, excel_rel
+    )
     print(f"Updated latest.json: {latest_path}")
     produced_paths.append(latest_path)
 
@@ -1149,6 +1486,10 @@ def main() -> None:
         "game": args.game,
         "pretty": args.pretty,
         "to_excel": args.to_excel,
+        "compress_raw": args.compress_raw,
+        "concurrency": args.concurrency,
+        "refresh": args.refresh,
+        "max_cache_age_hours": args.max_cache_age_hours,
         "since_week": since_week,
         "through_week": through_week,
         "include_playoffs": include_playoffs,
@@ -1160,6 +1501,7 @@ def main() -> None:
         run_ts=run_ts,
         cli_args=cli_args,
         produced_paths=produced_paths,
+        digests=digests,
     )
     manifest_path = _write_manifest(paths, run_ts, manifest_data)
     print(f"Wrote manifest: {manifest_path}")
@@ -4,28 +4,73 @@ Minimal raw tester to confirm API shape.
 It reads the Bearer token via src/auth/oauth.get_session and pulls three endpoints:
   /metadata, /settings, /teams
 Saves raw JSON/XML to ./exports/_debug and prints top keys.
+Set DEBUG_PRETTY=1 to indent the saved JSON (compact by default).
 """
 from __future__ import annotations
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import argparse
 
+try:
+    import orjson
+except ImportError:  # optional: stdlib json is used when orjson is absent
+    orjson = None
+
+try:
+    from lxml import etree
+except ImportError:  # optional: xmltodict (if installed) handles XML otherwise
+    etree = None
+
 from src.auth.oauth import get_session
 from src.config.env import get_export_dir
 
 API_BASE = "https://fantasysports.yahooapis.com/fantasy/v2"
+ENDPOINTS = ("metadata", "settings", "teams")
 
 def save(path: Path, data) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    pretty = bool(os.getenv("DEBUG_PRETTY"))
+    if orjson is not None:
+        buf = orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    else:
+        buf = json.dumps(data, ensure_ascii=False, indent=2 if pretty else None).encode("utf-8")
+    path.write_bytes(buf)
+
+def _elem_to_dict(elem):
+    """xmltodict-like view of an lxml element: attributes as '@name', repeated tags as lists."""
+    out = {f"@{etree.QName(k).localname}": v for k, v in elem.attrib.items()}
+    for child in elem:
+        if not isinstance(child.tag, str):  # comments / processing instructions
+            continue
+        tag = etree.QName(child).localname
+        value = _elem_to_dict(child)
+        if tag in out:
+            if not isinstance(out[tag], list):
+                out[tag] = [out[tag]]
+            out[tag].append(value)
+        else:
+            out[tag] = value
+    text = (elem.text or "").strip()
+    if not out:
+        return text or None
+    if text:
+        out["#text"] = text
+    return out
 
 def fetch(session, url: str):
     r = session.get(url, headers={"Accept": "application/json"})
     ctype = r.headers.get("Content-Type","")
     if "json" in ctype:
         return r.json()
-    # fallback XML to dict if available
+    # fallback XML to dict: lxml (C parser) first, then xmltodict if available
+    if etree is not None:
+        try:
+            root = etree.fromstring(r.content)
+            return {etree.QName(root).localname: _elem_to_dict(root)}
+        except etree.XMLSyntaxError:
+            return {"_raw": r.text, "_content_type": ctype}
     try:
         import xmltodict
         return xmltodict.parse(r.text)
@@ -47,9 +92,12 @@ def main():
     outdir = get_export_dir() / "_debug"
     sess = get_session()
 
-    for suffix in ["metadata", "settings", "teams"]:
-        url = f"{API_BASE}/league/{args.league_key}/{suffix}?format=json"
-        data = fetch(sess, url)
+    # The three endpoints are independent; fetch them concurrently over one session.
+    urls = [f"{API_BASE}/league/{args.league_key}/{suffix}?format=json" for suffix in ENDPOINTS]
+    with ThreadPoolExecutor(max_workers=len(urls)) as pool:
+        results = list(pool.map(lambda url: fetch(sess, url), urls))
+
+    for suffix, data in zip(ENDPOINTS, results):
         save(outdir / f"{suffix}.json", data)
         print(f"\n[{suffix}] top-level keys:", keys_of(data))
         if isinstance(data, dict) and "fantasy_content" in data:
@@ -16,14 +16,21 @@ Outputs under:
     excel/transactions.<ISO>.xlsx  (when --to-excel)
     manifest/manifest.<ISO>.json
 
+With --use-cache, scoreboards of completed weeks are also kept under
+exports/<league_key>/_meta/http_cache/ and reused on later runs.
+
 Usage example:
 
     python -m scripts.transactions_dump --league-key 465.l.22607 --to-excel --pretty
 """
 
 import argparse
+import bisect
+import hashlib
 import json
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -31,6 +38,11 @@ from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import requests
 
+try:
+    import orjson
+except ImportError:  # optional: stdlib json is used when orjson is absent
+    orjson = None
+
 from src.auth.oauth import get_session
 from src.config.env import get_export_dir
 from src.util_time import RunTimestamps, make_run_timestamps
@@ -38,6 +50,8 @@ from src.util_time import RunTimestamps, make_run_timestamps
 from src.yahoo.api_error import handle_api_error
 
 BASE_URL = "https://fantasysports.yahooapis.com/fantasy/v2"
+# Concurrent requests for the per-week scoreboard fetches.
+MAX_WORKERS = 8
 
 
 @dataclass
@@ -76,6 +90,22 @@ def _ensure_dirs(paths: Paths) -> None:
         d.mkdir(parents=True, exist_ok=True)
 
 
+# How each move arrived/left, keyed by the side that decides it:
+# adds by source_type, drops by destination_type.
+_ADD_VIA = {"freeagents": "free_agent", "waivers": "waivers", "team": "trade"}
+_DROP_VIA = {"waivers": "waivers", "team": "trade"}
+
+
+def _move_via(move_type: Optional[str], source_type: Optional[str], dest_type: Optional[str]) -> Optional[str]:
+    if move_type == "add":
+        return _ADD_VIA.get(source_type)
+    if move_type == "drop":
+        return _DROP_VIA.get(dest_type)
+    if move_type == "trade":
+        return "trade"
+    return None
+
+
 def _datetime_to_excel_serial(dt: datetime) -> float:
     """Convert a UTC datetime to an Excel serial (1900 date system).
 
@@ -87,11 +117,151 @@ def _datetime_to_excel_serial(dt: datetime) -> float:
     return delta.days + (delta.seconds + delta.microseconds / 1_000_000.0) / 86400.0
 
 
-def _fetch_json(session: requests.Session, path: str) -> Dict[str, Any]:
+def _loads(raw: bytes) -> Any:
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _http_cache_path(cache_dir: Path, path: str) -> Path:
+    return cache_dir / f"{hashlib.sha1(path.encode('utf-8')).hexdigest()}.json"
+
+
+def _read_http_cache(cache_dir: Path, path: str) -> Optional[Tuple[bytes, Dict[str, Any]]]:
+    cache_path = _http_cache_path(cache_dir, path)
+    try:
+        raw = cache_path.read_bytes()
+        return raw, _loads(raw)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_http_cache(cache_dir: Path, path: str, raw: bytes) -> None:
+    """Store a response body; written to a temp file and renamed into place."""
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    cache_path = _http_cache_path(cache_dir, path)
+    tmp = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(raw)
+    os.replace(tmp, cache_path)
+
+
+def _fetch_bytes(
+    session: requests.Session,
+    path: str,
+    cache_dir: Optional[Path] = None,
+) -> Tuple[bytes, Dict[str, Any]]:
+    """GET a JSON endpoint; return the response body as received plus its parsed payload.
+
+    With a ``cache_dir``, a cached body for the same path is returned instead
+    of hitting Yahoo, and fresh responses are saved there. Entries never
+    expire, so only pass one for responses that can no longer change.
+    """
+    if cache_dir is not None:
+        cached = _read_http_cache(cache_dir, path)
+        if cached is not None:
+            return cached
     url = f"{BASE_URL}/{path}?format=json"
     resp = session.get(url)
     handle_api_error(resp, f"endpoint {path}")
-    return resp.json()
+    payload = _loads(resp.content)
+    if cache_dir is not None:
+        _write_http_cache(cache_dir, path, resp.content)
+    return resp.content, payload
+
+
+def _fetch_json(
+    session: requests.Session,
+    path: str,
+    cache_dir: Optional[Path] = None,
+) -> Dict[str, Any]:
+    return _fetch_bytes(session, path, cache_dir)[1]
+
+
+def _fetch_transactions_paged(
+    session: requests.Session,
+    league_key: str,
+    page_size: int,
+    max_workers: int = MAX_WORKERS,
+) -> Dict[str, Any]:
+    """Fetch league transactions in ``transactions;start=N;count=page_size`` pages.
+
+    Pages are requested ``max_workers`` at a time until one comes back short.
+    The pages are merged into a payload of the same shape as the single
+    ``league/<key>/transactions`` response (keys renumbered "0".."N-1" plus
+    ``count``). Duplicate transaction_keys are dropped. If a non-empty page
+    holds nothing but duplicates, Yahoo is ignoring ``start``; paging would then
+    only ever see the first page, so this warns and falls back to the single
+    request instead.
+    """
+
+    def fetch_page(start: int) -> Dict[str, Any]:
+        return _fetch_json(session, f"league/{league_key}/transactions;start={start};count={page_size}")
+
+    def page_items(payload: Dict[str, Any]) -> List[Any]:
+        league = payload.get("fantasy_content", {}).get("league")
+        if not isinstance(league, list) or len(league) < 2:
+            return []
+        container = league[1].get("transactions")
+        if not isinstance(container, dict):
+            return []
+        return [v for k, v in container.items() if k != "count"]
+
+    def tx_key(item: Any) -> Any:
+        tx = item.get("transaction") if isinstance(item, dict) else None
+        if isinstance(tx, list) and tx and isinstance(tx[0], dict):
+            return tx[0].get("transaction_key")
+        return None
+
+    first_payload: Optional[Dict[str, Any]] = None
+    merged: List[Any] = []
+    seen: set = set()
+    start = 0
+    start_ignored = False
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        while True:
+            starts = [start + i * page_size for i in range(max_workers)]
+            pages = list(pool.map(fetch_page, starts))
+            if first_payload is None:
+                first_payload = pages[0]
+                league = first_payload.get("fantasy_content", {}).get("league")
+                if not isinstance(league, list) or len(league) < 2:
+                    raise ValueError("Unexpected paged transactions payload shape: missing league list")
+            done = False
+            for payload in pages:
+                items = page_items(payload)
+                added = 0
+                for item in items:
+                    key = tx_key(item)
+                    if key is not None:
+                        if key in seen:
+                            continue
+                        seen.add(key)
+                    merged.append(item)
+                    added += 1
+                if items and not added:
+                    start_ignored = done = True
+                    break
+                if len(items) < page_size:
+                    done = True
+                    break
+            if done:
+                break
+            start = starts[-1] + page_size
+
+    if start_ignored:
+        print(
+            "WARNING: transactions paging returned repeated pages (start ignored?); "
+            "falling back to a single request.",
+            file=sys.stderr,
+        )
+        return _fetch_json(session, f"league/{league_key}/transactions")
+
+    container: Dict[str, Any] = {str(i): item for i, item in enumerate(merged)}
+    container["count"] = len(merged)
+    league = list(first_payload["fantasy_content"]["league"])
+    league[1] = dict(league[1]) if isinstance(league[1], dict) else {}
+    league[1]["transactions"] = container
+    out = dict(first_payload)
+    out["fantasy_content"] = dict(first_payload["fantasy_content"], league=league)
+    return out
 
 
 def _load_league_context(paths: Paths) -> Tuple[Dict[str, Any], str]:
@@ -163,79 +333,104 @@ def _load_league_context(paths: Paths) -> Tuple[Dict[str, Any], str]:
     return league_dump, processed_rel
 
 
+def _parse_scoreboard_week(wk: int, payload: Dict[str, Any]) -> Optional[WeekRange]:
+    """Extract the WeekRange for week ``wk`` from a scoreboard payload, if present."""
+    fc = payload.get("fantasy_content", {})
+    league = fc.get("league")
+    if not isinstance(league, list) or len(league) < 2:
+        return None
+    sb = league[1].get("scoreboard")
+    if not isinstance(sb, dict):
+        return None
+    sb_week = sb.get("week")
+    root = sb.get("0")
+    if not isinstance(root, dict):
+        return None
+    matchups = root.get("matchups")
+    if not isinstance(matchups, dict):
+        return None
+
+    meta = None
+    for mk, mv in matchups.items():
+        if mk == "count":
+            continue
+        matchup = mv.get("matchup")
+        if isinstance(matchup, list) and matchup:
+            meta = matchup[0]
+        elif isinstance(matchup, dict):
+            meta = matchup
+        if isinstance(meta, dict):
+            break
+
+    if not isinstance(meta, dict):
+        return None
+
+    start_date = meta.get("week_start")
+    end_date = meta.get("week_end")
+    if not start_date or not end_date:
+        return None
+
+    is_playoffs_raw = meta.get("is_playoffs")
+    is_playoffs: Optional[bool]
+    if isinstance(is_playoffs_raw, str):
+        is_playoffs = is_playoffs_raw == "1"
+    elif isinstance(is_playoffs_raw, (int, bool)):
+        is_playoffs = bool(is_playoffs_raw)
+    else:
+        is_playoffs = None
+
+    try:
+        week_num = int(sb_week) if sb_week is not None else wk
+    except Exception:
+        week_num = wk
+
+    return WeekRange(week=week_num, start_date=start_date, end_date=end_date, is_playoffs=is_playoffs)
+
+
 def _build_week_index(
     session: requests.Session,
     league_key: str,
     start_week: int,
     end_week: int,
     head_to_head: Dict[str, Any],
+    cache_dir: Optional[Path] = None,
+    closed_before_week: Optional[int] = None,
 ) -> List[WeekRange]:
     """Build a list of WeekRange from scoreboard;week=N for each week.
 
     We only use this to map transaction timestamps → matchup weeks. If any
     particular week fails to fetch, it is skipped; transactions that cannot
     be mapped will have week=None.
-    """
-    ranges: List[WeekRange] = []
-
-    for wk in range(start_week, end_week + 1):
-        path = f"league/{league_key}/scoreboard;week={wk}"
-        try:
-            payload = _fetch_json(session, path)
-        except requests.HTTPError as exc:
-            print(f"WARNING: Failed to fetch scoreboard for week {wk}: {exc}", file=sys.stderr)
-            continue
-
-        fc = payload.get("fantasy_content", {})
-        league = fc.get("league")
-        if not isinstance(league, list) or len(league) < 2:
-            continue
-        sb = league[1].get("scoreboard")
-        if not isinstance(sb, dict):
-            continue
-        sb_week = sb.get("week")
-        root = sb.get("0")
-        if not isinstance(root, dict):
-            continue
-        matchups = root.get("matchups")
-        if not isinstance(matchups, dict):
-            continue
 
-        meta = None
-        for mk, mv in matchups.items():
-            if mk == "count":
-                continue
-            matchup = mv.get("matchup")
-            if isinstance(matchup, list) and matchup:
-                meta = matchup[0]
-            elif isinstance(matchup, dict):
-                meta = matchup
-            if isinstance(meta, dict):
-                break
-
-        if not isinstance(meta, dict):
-            continue
-
-        start_date = meta.get("week_start")
-        end_date = meta.get("week_end")
-        if not start_date or not end_date:
-            continue
-
-        is_playoffs_raw = meta.get("is_playoffs")
-        is_playoffs: Optional[bool]
-        if isinstance(is_playoffs_raw, str):
-            is_playoffs = is_playoffs_raw == "1"
-        elif isinstance(is_playoffs_raw, (int, bool)):
-            is_playoffs = bool(is_playoffs_raw)
-        else:
-            is_playoffs = None
+    The per-week requests are independent, so they are issued concurrently
+    over the shared session and then parsed in week order. With a
+    ``cache_dir``, weeks before ``closed_before_week`` (the league's current
+    week) are completed and served from / saved to that cache.
+    """
+    weeks = list(range(start_week, end_week + 1))
 
+    def fetch_week(wk: int) -> Any:
         try:
-            week_num = int(sb_week) if sb_week is not None else wk
-        except Exception:
-            week_num = wk
+            closed = closed_before_week is not None and wk < closed_before_week
+            return _fetch_json(
+                session, f"league/{league_key}/scoreboard;week={wk}", cache_dir if closed else None
+            )
+        except Exception as exc:
+            # Any single-week failure (HTTP error, or e.g. an OSError from a token
+            # refresh racing in another thread) is reported and skipped below.
+            # Fatal API errors (SystemExit from handle_api_error) still propagate.
+            return exc
 
-        ranges.append(WeekRange(week=week_num, start_date=start_date, end_date=end_date, is_playoffs=is_playoffs))
+    ranges: List[WeekRange] = []
+    if weeks:
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(weeks))) as pool:
+            for wk, payload in zip(weeks, pool.map(fetch_week, weeks)):
+                if isinstance(payload, Exception):
+                    print(f"WARNING: Failed to fetch scoreboard for week {wk}: {payload}", file=sys.stderr)
+                    continue
+                wr = _parse_scoreboard_week(wk, payload)
+                if wr is not None:
+                    ranges.append(wr)
 
     # Normalize playoff flags using head_to_head if necessary
     h2h_playoff_start = None
@@ -258,10 +453,18 @@ def _build_week_index(
     return ranges
 
 
-def _lookup_week(week_index: Iterable[WeekRange], date_str: str) -> Tuple[Optional[int], Optional[bool]]:
-    """Return (week, is_playoffs) for a YYYY-MM-DD date string, if known."""
-    for wr in week_index:
-        if wr.start_date <= date_str <= wr.end_date:
+def _lookup_week(
+    week_index: List[WeekRange], starts: List[str], date_str: str
+) -> Tuple[Optional[int], Optional[bool]]:
+    """Return (week, is_playoffs) for a YYYY-MM-DD date string, if known.
+
+    ``week_index`` must be sorted by start_date, with ``starts`` holding those
+    start dates; week ranges don't overlap, so a bisect finds the candidate.
+    """
+    i = bisect.bisect_right(starts, date_str) - 1
+    if i >= 0:
+        wr = week_index[i]
+        if date_str <= wr.end_date:
             return wr.week, wr.is_playoffs
     return None, None
 
@@ -304,15 +507,17 @@ def _normalize_transactions(
             else:
                 norm_filter.add(t)
 
-    def _extract_team_name(team_key: Optional[str]) -> Optional[str]:
-        if not team_key:
-            return None
-        for t in teams:
-            if t.get("team_key") == team_key:
-                return t.get("name")
-        return None
+    # team_key -> name, built once (first entry wins, as the old list scan did).
+    team_name_by_key: Dict[str, Any] = {}
+    for t in teams:
+        tk = t.get("team_key")
+        if tk:
+            team_name_by_key.setdefault(tk, t.get("name"))
+    team_name = team_name_by_key.get
 
     week_index_list = list(week_index)
+    weeks_by_start = sorted(week_index_list, key=lambda wr: wr.start_date)
+    week_starts = [wr.start_date for wr in weeks_by_start]
 
     transactions_out: List[Dict[str, Any]] = []
 
@@ -372,7 +577,7 @@ def _normalize_transactions(
             ts_iso_utc = dt_utc.isoformat().replace("+00:00", "Z")
             ts_excel = _datetime_to_excel_serial(dt_utc)
             date_str = dt_utc.date().isoformat()
-            week_val, is_playoffs = _lookup_week(week_index_list, date_str)
+            week_val, is_playoffs = _lookup_week(weeks_by_start, week_starts, date_str)
         else:
             ts_iso_utc = None
             ts_excel = None
@@ -440,24 +645,8 @@ def _normalize_transactions(
                     from_team_key = td.get("source_team_key") if source_type == "team" else None
                     to_team_key = td.get("destination_team_key") if dest_type == "team" else None
 
-                    from_team_name = td.get("source_team_name") or _extract_team_name(from_team_key)
-                    to_team_name = td.get("destination_team_name") or _extract_team_name(to_team_key)
-
-                    via: Optional[str] = None
-                    if move_type == "add":
-                        if source_type == "freeagents":
-                            via = "free_agent"
-                        elif source_type == "waivers":
-                            via = "waivers"
-                        elif source_type == "team":
-                            via = "trade"
-                    elif move_type == "drop":
-                        if dest_type == "waivers":
-                            via = "waivers"
-                        elif dest_type == "team":
-                            via = "trade"
-                    elif move_type == "trade":
-                        via = "trade"
+                    from_team_name = td.get("source_team_name") or team_name(from_team_key)
+                    to_team_name = td.get("destination_team_name") or team_name(to_team_key)
 
                     move = {
                         "player_key": player_key,
@@ -472,7 +661,7 @@ def _normalize_transactions(
                         "to_team_name": to_team_name,
                         "source_type": source_type,
                         "destination_type": dest_type,
-                        "via": via,
+                        "via": _move_via(move_type, source_type, dest_type),
                         "waiver_priority_before": td.get("waiver_priority_before"),
                         "waiver_priority_after": td.get("waiver_priority_after"),
                         "faab_bid": td.get("faab_bid"),
@@ -528,6 +717,9 @@ def _normalize_transactions(
 
 def _dump_json(data: Any, path: Path, pretty: bool) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0))
+        return
     with path.open("w", encoding="utf-8") as f:
         if pretty:
             json.dump(data, f, indent=2, sort_keys=False)
@@ -652,11 +844,12 @@ def _write_excel(transactions: List[Dict[str, Any]], path: Path) -> None:
 
 
 def _sha256_of_file(path: Path) -> str:
-    import hashlib
-
-    h = hashlib.sha256()
     with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
+        # Python 3.11+: hashed in C with the GIL released.
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        h = hashlib.sha256()
+        for chunk in iter(lambda: f.read(1 << 20), b""):
             h.update(chunk)
     return h.hexdigest()
 
@@ -666,27 +859,28 @@ def _write_manifest(
     league_key: str,
     run_ts: RunTimestamps,
     cli_args: Dict[str, Any],
-    raw_path: Path,
-    processed_path: Path,
-    excel_path: Optional[Path],
+    produced: Dict[str, Path],
 ) -> Path:
+    """Write the run manifest.
+
+    ``produced`` maps league-root-relative POSIX paths (computed once in
+    ``main``) to the absolute files they refer to.
+    """
     paths.manifest_dir.mkdir(parents=True, exist_ok=True)
     manifest_path = paths.manifest_dir / f"manifest.{run_ts.iso_stamp}.json"
 
-    def rel(p: Path) -> str:
-        return p.relative_to(paths.league_root).as_posix()
+    existing = {rel: p for rel, p in produced.items() if p.exists()}
+    # Hash the files concurrently (hashing releases the GIL).
+    digests: Dict[str, str] = {}
+    if existing:
+        with ThreadPoolExecutor(max_workers=len(existing)) as pool:
+            digests.update(zip(existing, pool.map(_sha256_of_file, existing.values())))
 
     files: Dict[str, Dict[str, Any]] = {}
-    for p in (raw_path, processed_path):
-        if p.exists():
-            files[rel(p)] = {
-                "size_bytes": p.stat().st_size,
-                "sha256": _sha256_of_file(p),
-            }
-    if excel_path is not None and excel_path.exists():
-        files[rel(excel_path)] = {
-            "size_bytes": excel_path.stat().st_size,
-            "sha256": _sha256_of_file(excel_path),
+    for rel_path, abs_path in existing.items():
+        files[rel_path] = {
+            "size_bytes": abs_path.stat().st_size,
+            "sha256": digests[rel_path],
         }
 
     manifest = {
@@ -706,8 +900,8 @@ def _write_manifest(
 def _update_latest_meta(
     paths: Paths,
     league_key: str,
-    processed_path: Path,
-    excel_path: Optional[Path],
+    processed_rel: str,
+    excel_rel: Optional[str],
     run_ts: RunTimestamps,
 ) -> None:
     latest_path = paths.meta_dir / "latest.json"
@@ -722,16 +916,9 @@ def _update_latest_meta(
 
     latest["league_key"] = league_key
 
-    rel_processed = processed_path.relative_to(paths.league_root).as_posix()
-    rel_excel = (
-        excel_path.relative_to(paths.league_root).as_posix()
-        if excel_path is not None and excel_path.exists()
-        else None
-    )
-
-    tx_block: Dict[str, Any] = {"processed": rel_processed}
-    if rel_excel is not None:
-        tx_block["excel"] = rel_excel
+    tx_block: Dict[str, Any] = {"processed": processed_rel}
+    if excel_rel is not None:
+        tx_block["excel"] = excel_rel
 
     latest["transactions_dump"] = tx_block
     latest["_updated_unix"] = run_ts.unix
@@ -761,6 +948,23 @@ def _parse_args() -> argparse.Namespace:
     )
     p.add_argument("--pretty", action="store_true", help="Pretty-print JSON outputs.")
     p.add_argument("--to-excel", action="store_true", help="Also write an Excel workbook.")
+    p.add_argument(
+        "--page-size",
+        type=int,
+        default=0,
+        help=(
+            "Fetch transactions in pages of this many (requested concurrently) "
+            "instead of one request. Default 0 = single request."
+        ),
+    )
+    p.add_argument(
+        "--use-cache",
+        action="store_true",
+        help=(
+            "Cache scoreboards of completed weeks under _meta/http_cache/ and reuse them "
+            "on later runs. Transactions are always fetched fresh."
+        ),
+    )
     return p.parse_args()
 
 
@@ -790,15 +994,38 @@ def main() -> None:
 
     run_ts = make_run_timestamps()
 
+    cache_dir: Optional[Path] = paths.meta_dir / "http_cache" if args.use_cache else None
+    try:
+        current_week: Optional[int] = int(league_info.get("current_week"))
+    except (TypeError, ValueError):
+        current_week = None
+
     # Build week index from scoreboard;week=N
-    week_index = _build_week_index(session, league_key, start_week, end_week, head_to_head)
+    week_index = _build_week_index(
+        session,
+        league_key,
+        start_week,
+        end_week,
+        head_to_head,
+        cache_dir=cache_dir,
+        closed_before_week=current_week,
+    )
 
-    # Fetch transactions
-    raw_payload = _fetch_json(session, f"league/{league_key}/transactions")
+    # Fetch transactions. A single-request response is kept as received so the
+    # compact raw snapshot can be written without re-serializing it; paged
+    # fetches are merged, so they always go through _dump_json.
+    raw_bytes: Optional[bytes] = None
+    if args.page_size > 0:
+        raw_payload = _fetch_transactions_paged(session, league_key, args.page_size)
+    else:
+        raw_bytes, raw_payload = _fetch_bytes(session, f"league/{league_key}/transactions")
 
     # Save raw snapshot
     raw_path = paths.raw_dir / f"transactions.{run_ts.iso_stamp}.json"
-    _dump_json(raw_payload, raw_path, pretty=args.pretty)
+    if raw_bytes is not None and not args.pretty:
+        raw_path.write_bytes(raw_bytes)
+    else:
+        _dump_json(raw_payload, raw_path, pretty=args.pretty)
     print(f"Wrote raw transactions JSON: {raw_path}")
 
     # Normalize
@@ -826,7 +1053,17 @@ def main() -> None:
         _write_excel(processed.get("transactions", []), excel_path)
         print(f"Wrote Excel workbook: {excel_path}")
 
-    # Manifest + meta update
+    # Manifest + meta update (relative paths computed once and shared)
+    raw_rel = raw_path.relative_to(paths.league_root).as_posix()
+    processed_rel = processed_path.relative_to(paths.league_root).as_posix()
+    excel_rel: Optional[str] = (
+        excel_path.relative_to(paths.league_root).as_posix() if excel_path is not None else None
+    )
+
+    produced: Dict[str, Path] = {raw_rel: raw_path, processed_rel: processed_path}
+    if excel_path is not None and excel_rel is not None:
+        produced[excel_rel] = excel_path
+
     cli_args = {
         "league_key": league_key,
         "league_id": args.league_id,
@@ -835,6 +1072,8 @@ def main() -> None:
         "include_meta": args.include_meta,
         "pretty": args.pretty,
         "to_excel": args.to_excel,
+        "page_size": args.page_size,
+        "use_cache": args.use_cache,
     }
 
     manifest_path = _write_manifest(
@@ -842,17 +1081,15 @@ def main() -> None:
         league_key=league_key,
         run_ts=run_ts,
         cli_args=cli_args,
-        raw_path=raw_path,
-        processed_path=processed_path,
-        excel_path=excel_path,
+        produced=produced,
     )
     print(f"Wrote manifest: {manifest_path}")
 
     _update_latest_meta(
         paths=paths,
         league_key=league_key,
-        processed_path=processed_path,
-        excel_path=excel_path,
+        processed_rel=processed_rel,
+        excel_rel=excel_rel,
         run_ts=run_ts,
     )
     print(f"Updated latest metadata: {paths.meta_dir / 'latest.json'}")
@@ -190,12 +190,17 @@ def _run_local_server(
 # ====================
 # PUBLIC ENTRY POINTS
 # ====================
-def get_session() -> Session:
+def get_session(token_file: Optional[str] = None) -> Session:
     """Get authenticated requests session with auto-refreshing OAuth2 tokens.
 
     Returns a requests.Session configured with Bearer authentication that
     automatically refreshes expired tokens. Handles both existing valid tokens
-    and new authentication flows.
+    and new authentication flows. A token on disk that is still within its
+    ``expires_at`` is reused as-is, so no refresh round-trip is made.
+
+    Args:
+        token_file: Optional path to the token JSON. Defaults to TOKEN_FILE
+            from the environment/.env (or ./data/yahoo_token.json).
 
     Returns:
         Authenticated requests.Session with auto-refresh capability
@@ -208,7 +213,7 @@ def get_session() -> Session:
     client_secret = env.get("YAHOO_CLIENT_SECRET", "").strip()
     redirect_uri = env.get("YAHOO_REDIRECT_URI", "").strip()
     scope = (env.get("YAHOO_SCOPE") or DEFAULT_SCOPE).strip()
-    token_file = env.get("TOKEN_FILE", DEFAULT_TOKEN_FILE).strip()
+    token_file = (token_file or env.get("TOKEN_FILE", DEFAULT_TOKEN_FILE)).strip()
     manual = (env.get("OAUTH_MANUAL", "0").strip() == "1")
     prompt = env.get("OAUTH_PROMPT", "").strip()
     tls_cert = env.get("TLS_CERT_FILE", "").strip()
@@ -8,7 +8,7 @@ from datetime import datetime, timezone, timedelta
 # Excel's day 0 (Windows) is 1899-12-30, including the 1900 leap year bug.
 EXCEL_EPOCH = datetime(1899, 12, 30, tzinfo=timezone.utc)
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RunTimestamps:
     """Container for various timestamp formats used throughout the application.
 
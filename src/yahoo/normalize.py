@@ -1,5 +1,17 @@
+import sys
 from typing import Any, Dict, List, Optional
 
+def intern_value(value: Any) -> Any:
+    """Intern string values so repeated keys/IDs share one object.
+
+    Args:
+        value: Value to intern
+
+    Returns:
+        sys.intern(value) for strings, otherwise the value unchanged
+    """
+    return sys.intern(value) if type(value) is str else value
+
 def _safe_convert_to_int(value: Any) -> Optional[int]:
     """Safely convert value to integer.
 